@@ -1,6 +1,15 @@
 from flask import Flask, render_template, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+from concurrent.futures import ProcessPoolExecutor, wait as wait_futures
+from concurrent.futures.process import BrokenProcessPool
+import functools
 import os
-from concepts.cpu_scheduling.algorithms import Scheduler as CPUScheduler, Process as CPUProcess
+import threading
+import orjson
+from concepts.cpu_scheduling.algorithms import (
+    Process as CPUProcess,
+    fcfs as cpu_fcfs, sjf as cpu_sjf, round_robin as cpu_round_robin, priority_scheduling as cpu_priority_scheduling
+)
 from concepts.deadlock.algorithms import *
 from concepts.memory_management.algorithms import *
 from concepts.synchronization.algorithms import SynchronizationProcess, Semaphore, Mutex, ProducerConsumer, DiningPhilosophers, ReadersWriters
@@ -9,15 +18,141 @@ from concepts.processes_threads.algorithms import Process as PTProcess, Thread,
 from concepts.io_management.algorithms import *
 from concepts.resource_allocation.algorithms import *
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that parses requests and serializes responses with orjson."""
+    option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self.option),
+            mimetype=self.mimetype
+        )
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+@functools.lru_cache(maxsize=32)
+def _empty_fs_usage_json(total_blocks):
+    """Pre-serialized disk usage of a freshly created FileSystem."""
+    return app.json.dumps(FileSystem(total_blocks).get_disk_usage())
+
+def _int_list(values):
+    """Convert a JSON array of numbers/strings to a list of ints."""
+    return list(map(int, values))
+
+def _parse_processes(processes_data, with_priority=False):
+    """Build resource-allocation Processes from their JSON form."""
+    if with_priority:
+        return [Process(p['pid'], _int_list(p['max_resources']), _int_list(p['allocated_resources']),
+                        int(p.get('priority', 0)), int(p.get('arrival_time', 0)))
+                for p in processes_data]
+    return [Process(p['pid'], _int_list(p['max_resources']), _int_list(p['allocated_resources']))
+            for p in processes_data]
+
+def _parse_resources(resources_data):
+    """Build Resources from their JSON form."""
+    return [Resource(r['rid'], int(r['total_instances'])) for r in resources_data]
+
+# Algorithm name -> implementation, resolved once per request with a dict lookup
+CPU_DISPATCH = {
+    'FCFS': lambda processes, time_quantum: cpu_fcfs(processes),
+    'SJF': lambda processes, time_quantum: cpu_sjf(processes),
+    'Round Robin': cpu_round_robin,
+    'Priority': lambda processes, time_quantum: cpu_priority_scheduling(processes),
+}
+
+# Worker pool for running the CPU schedulers side by side in /cpu_scheduling/compare.
+# Created lazily and per process: a pool inherited across a fork (e.g. gunicorn
+# workers) would share its queue pipes with the other workers.
+_compare_executor = None
+_compare_executor_pid = None
+_compare_executor_lock = threading.Lock()
+
+# Seconds to wait for the compare results, kept under gunicorn's worker timeout
+COMPARE_TIMEOUT = 10
+
+def _get_compare_executor():
+    """Return this process's scheduler pool, creating it on first use."""
+    global _compare_executor, _compare_executor_pid
+    with _compare_executor_lock:
+        if _compare_executor is None or _compare_executor_pid != os.getpid():
+            _compare_executor = ProcessPoolExecutor(max_workers=len(CPU_DISPATCH))
+            _compare_executor_pid = os.getpid()
+        return _compare_executor
+
+def _discard_compare_executor(executor):
+    """Drop a pool that overran or broke, so the next compare gets a fresh one."""
+    global _compare_executor
+    with _compare_executor_lock:
+        if _compare_executor is executor:
+            _compare_executor = None
+    # Queued schedulers are cancelled; one already running exits when it finishes
+    executor.shutdown(wait=False, cancel_futures=True)
+
+def _run_cpu_scheduler(algorithm, processes, time_quantum):
+    """Picklable entry point for running one CPU scheduler in the worker pool."""
+    return CPU_DISPATCH[algorithm](processes, time_quantum)
+
+def _serialize_schedule(result):
+    """Make a CPU scheduling result JSON-serializable."""
+    result['processes'] = [{'pid': p.pid, 'waiting_time': p.waiting_time, 'turnaround_time': p.turnaround_time} for p in result['processes']]
+    return result
+
+MEM_ALLOC_DISPATCH = {
+    'first_fit': MemoryManager.first_fit,
+    'best_fit': MemoryManager.best_fit,
+    'worst_fit': MemoryManager.worst_fit,
+}
+
+PAGE_REPLACE_DISPATCH = {
+    'fifo': PageReplacement.fifo,
+    'lru': PageReplacement.lru,
+    'optimal': PageReplacement.optimal,
+}
+
+IO_DISPATCH = {
+    'fcfs': IOScheduler.fcfs,
+    'sstf': IOScheduler.sstf,
+    'scan': IOScheduler.scan,
+}
+
+RESOURCE_DISPATCH = {
+    'bankers': lambda processes, resources, requests, time_quantum: ResourceAllocationAlgorithms.bankers_algorithm(processes, resources),
+    'fcfs': lambda processes, resources, requests, time_quantum: ResourceAllocationAlgorithms.fcfs_allocation(processes, resources, requests),
+    'priority': lambda processes, resources, requests, time_quantum: ResourceAllocationAlgorithms.priority_allocation(processes, resources, requests),
+    'round_robin': ResourceAllocationAlgorithms.round_robin_allocation,
+    'fair_share': lambda processes, resources, requests, time_quantum: ResourceAllocationAlgorithms.fair_share_allocation(processes, resources),
+}
+
+# The page templates take no context, so render each once at import
+_PAGES = (
+    'index.html',
+    'cpu_scheduling.html',
+    'deadlock.html',
+    'memory_management.html',
+    'synchronization.html',
+    'file_systems.html',
+    'processes_threads.html',
+    'io_management.html',
+    'resource_allocation.html',
+)
+with app.app_context():
+    _RENDERED_PAGES = {name: render_template(name) for name in _PAGES}
 
 @app.route('/')
 def index():
-    return render_template('index.html')
+    return _RENDERED_PAGES['index.html']
 
 @app.route('/cpu_scheduling')
 def cpu_scheduling():
-    return render_template('cpu_scheduling.html')
+    return _RENDERED_PAGES['cpu_scheduling.html']
 
 @app.route('/cpu_scheduling/run', methods=['POST'])
 def run_cpu_scheduling():
@@ -30,34 +165,44 @@ def run_cpu_scheduling():
     for p in processes_data:
         processes.append(CPUProcess(p['pid'], int(p['arrival']), int(p['burst']), int(p['priority'])))
     
-    if algorithm == 'FCFS':
-        result = CPUScheduler.fcfs(processes)
-    elif algorithm == 'SJF':
-        result = CPUScheduler.sjf(processes)
-    elif algorithm == 'Round Robin':
-        result = CPUScheduler.round_robin(processes, time_quantum)
-    elif algorithm == 'Priority':
-        result = CPUScheduler.priority_scheduling(processes)
-
-    # Serialize processes for JSON
-    result['processes'] = [{'pid': p.pid, 'waiting_time': p.waiting_time, 'turnaround_time': p.turnaround_time} for p in result['processes']]
-    result['order'] = [p[0] for p in result['gantt_chart']]  # Extract order from gantt chart
+    scheduler = CPU_DISPATCH.get(algorithm)
+    if scheduler is None:
+        return jsonify({'error': 'Invalid algorithm'})
+    result = scheduler(processes, time_quantum)
 
-    return jsonify(result)
+    return jsonify(_serialize_schedule(result))
 
-@app.route('/deadlock/bankers', methods=['POST'])
-def run_bankers_algorithm():
+@app.route('/cpu_scheduling/compare', methods=['POST'])
+def compare_cpu_scheduling():
     data = request.json
+    time_quantum = int(data.get('time_quantum', 2))
     processes_data = data['processes']
-    resources_data = data['resources']
 
-    processes = []
-    for p in processes_data:
-        processes.append(Process(p['pid'], [int(x) for x in p['max_resources']], [int(x) for x in p['allocated_resources']]))
+    processes = [CPUProcess(p['pid'], int(p['arrival']), int(p['burst']), int(p['priority'])) for p in processes_data]
+
+    # The schedulers are independent and CPU-bound, so run them in parallel
+    executor = _get_compare_executor()
+    try:
+        futures = {algorithm: executor.submit(_run_cpu_scheduler, algorithm, processes, time_quantum)
+                   for algorithm in CPU_DISPATCH}
+
+        # One deadline for the whole comparison rather than one per scheduler
+        _, not_done = wait_futures(futures.values(), timeout=COMPARE_TIMEOUT)
+        if not_done:
+            _discard_compare_executor(executor)
+            return jsonify({'error': 'Comparison timed out'})
+        results = {algorithm: future.result() for algorithm, future in futures.items()}
+    except BrokenProcessPool:
+        # A pool worker died; replace the pool rather than failing every later compare
+        _discard_compare_executor(executor)
+        return jsonify({'error': 'Comparison failed'})
+    return jsonify({algorithm: _serialize_schedule(result) for algorithm, result in results.items()})
 
-    resources = []
-    for r in resources_data:
-        resources.append(Resource(r['rid'], int(r['total_instances'])))
+@app.route('/deadlock/bankers', methods=['POST'])
+def run_bankers_algorithm():
+    data = request.json
+    processes = _parse_processes(data['processes'])
+    resources = _parse_resources(data['resources'])
 
     result = DeadlockAlgorithms.bankers_algorithm(processes, resources)
     return jsonify(result)
@@ -71,10 +216,8 @@ def detect_deadlock():
         wait_for_graph = data['wait_for_graph']
         result = DeadlockAlgorithms.detect_deadlock_wait_for_graph(wait_for_graph)
     elif method == 'resource_allocation':
-        processes_data = data['processes']
-        resources_data = data['resources']
-        processes = [Process(p['pid'], p['max_resources'], p['allocated_resources']) for p in processes_data]
-        resources = [Resource(r['rid'], r['total_instances']) for r in resources_data]
+        processes = _parse_processes(data['processes'])
+        resources = _parse_resources(data['resources'])
         result = DeadlockAlgorithms.detect_deadlock_resource_allocation(processes, resources)
     else:
         result = {'error': 'Invalid method'}
@@ -84,13 +227,11 @@ def detect_deadlock():
 @app.route('/deadlock/request', methods=['POST'])
 def simulate_resource_request():
     data = request.json
-    processes_data = data['processes']
-    resources_data = data['resources']
     process_id = data['process_id']
-    req = [int(x) for x in data['request']]
+    req = _int_list(data['request'])
 
-    processes = [Process(p['pid'], [int(x) for x in p['max_resources']], [int(x) for x in p['allocated_resources']]) for p in processes_data]
-    resources = [Resource(r['rid'], int(r['total_instances'])) for r in resources_data]
+    processes = _parse_processes(data['processes'])
+    resources = _parse_resources(data['resources'])
 
     result = DeadlockAlgorithms.simulate_request(processes, resources, process_id, req)
     return jsonify(result)
@@ -107,14 +248,10 @@ def allocate_memory():
     for b in blocks_data:
         blocks.append(MemoryBlock(b['start'], b['size'], b.get('process_id')))
 
-    if algorithm == 'first_fit':
-        result = MemoryManager.first_fit(blocks, process_size, process_id)
-    elif algorithm == 'best_fit':
-        result = MemoryManager.best_fit(blocks, process_size, process_id)
-    elif algorithm == 'worst_fit':
-        result = MemoryManager.worst_fit(blocks, process_size, process_id)
-    else:
+    allocator = MEM_ALLOC_DISPATCH.get(algorithm)
+    if allocator is None:
         return jsonify({'error': 'Invalid algorithm'})
+    result = allocator(blocks, process_size, process_id)
 
     return jsonify({
         'allocated_address': result,
@@ -145,14 +282,10 @@ def page_replacement():
     page_sequence = data['page_sequence']
     num_frames = data['num_frames']
 
-    if algorithm == 'fifo':
-        result = PageReplacement.fifo(page_sequence, num_frames)
-    elif algorithm == 'lru':
-        result = PageReplacement.lru(page_sequence, num_frames)
-    elif algorithm == 'optimal':
-        result = PageReplacement.optimal(page_sequence, num_frames)
-    else:
+    replacer = PAGE_REPLACE_DISPATCH.get(algorithm)
+    if replacer is None:
         return jsonify({'error': 'Invalid algorithm'})
+    result = replacer(page_sequence, num_frames)
 
     return jsonify(result)
 
@@ -356,10 +489,8 @@ def disk_usage():
     data = request.json
     total_blocks = data.get('total_blocks', 100)
 
-    fs = FileSystem(total_blocks)
-    usage = fs.get_disk_usage()
-
-    return jsonify(usage)
+    # A fresh file system holds no state, so its usage depends only on its size
+    return app.response_class(_empty_fs_usage_json(total_blocks), mimetype='application/json')
 
 @app.route('/processes_threads/simulate_processes', methods=['POST'])
 def simulate_processes():
@@ -381,10 +512,8 @@ def simulate_threads():
     model = data.get('model', 'USER_LEVEL')
     max_time = data.get('max_time', 50)
 
-    threads = []
-    for t in threads_data:
-        thread_model = ThreadModel.USER_LEVEL if model == 'USER_LEVEL' else ThreadModel.KERNEL_LEVEL if model == 'KERNEL_LEVEL' else ThreadModel.HYBRID
-        threads.append(Thread(t['tid'], t['pid'], thread_model))
+    thread_model = ThreadModel.USER_LEVEL if model == 'USER_LEVEL' else ThreadModel.KERNEL_LEVEL if model == 'KERNEL_LEVEL' else ThreadModel.HYBRID
+    threads = [Thread(t['tid'], t['pid'], thread_model) for t in threads_data]
 
     result = ThreadManager.simulate_thread_execution(threads, max_time)
     return jsonify(result)
@@ -424,14 +553,10 @@ def io_schedule():
 
     device = DeviceDriver("disk")
 
-    if algorithm == 'fcfs':
-        result = IOScheduler.fcfs(requests, device)
-    elif algorithm == 'sstf':
-        result = IOScheduler.sstf(requests, device)
-    elif algorithm == 'scan':
-        result = IOScheduler.scan(requests, device)
-    else:
+    scheduler = IO_DISPATCH.get(algorithm)
+    if scheduler is None:
         return jsonify({'error': 'Invalid algorithm'})
+    result = scheduler(requests, device)
 
     return jsonify(result)
 
@@ -439,64 +564,48 @@ def io_schedule():
 def resource_allocate():
     data = request.json
     policy = data['policy']
-    processes_data = data['processes']
-    resources_data = data['resources']
     requests_data = data.get('requests', [])
 
-    processes = []
-    for p in processes_data:
-        processes.append(Process(p['pid'], [int(x) for x in p['max_resources']], [int(x) for x in p['allocated_resources']], int(p.get('priority', 0)), int(p.get('arrival_time', 0))))
-
-    resources = []
-    for r in resources_data:
-        resources.append(Resource(r['rid'], int(r['total_instances'])))
-
-    requests = [(req['pid'], [int(x) for x in req['request']]) for req in requests_data]
-
-    if policy == 'bankers':
-        result = ResourceAllocationAlgorithms.bankers_algorithm(processes, resources)
-    elif policy == 'fcfs':
-        result = ResourceAllocationAlgorithms.fcfs_allocation(processes, resources, requests)
-    elif policy == 'priority':
-        result = ResourceAllocationAlgorithms.priority_allocation(processes, resources, requests)
-    elif policy == 'round_robin':
-        time_quantum = int(data.get('time_quantum', 1))
-        result = ResourceAllocationAlgorithms.round_robin_allocation(processes, resources, requests, time_quantum)
-    elif policy == 'fair_share':
-        result = ResourceAllocationAlgorithms.fair_share_allocation(processes, resources)
-    else:
+    processes = _parse_processes(data['processes'], with_priority=True)
+    resources = _parse_resources(data['resources'])
+
+    requests = [(req['pid'], _int_list(req['request'])) for req in requests_data]
+
+    allocator = RESOURCE_DISPATCH.get(policy)
+    if allocator is None:
         return jsonify({'error': 'Invalid policy'})
+    result = allocator(processes, resources, requests, int(data.get('time_quantum', 1)))
 
     return jsonify(result)
 
 # Add routes for other concepts similarly
 @app.route('/deadlock')
 def deadlock():
-    return render_template('deadlock.html')
+    return _RENDERED_PAGES['deadlock.html']
 
 @app.route('/memory_management')
 def memory_management():
-    return render_template('memory_management.html')
+    return _RENDERED_PAGES['memory_management.html']
 
 @app.route('/synchronization')
 def synchronization():
-    return render_template('synchronization.html')
+    return _RENDERED_PAGES['synchronization.html']
 
 @app.route('/file_systems')
 def file_systems():
-    return render_template('file_systems.html')
+    return _RENDERED_PAGES['file_systems.html']
 
 @app.route('/processes_threads')
 def processes_threads():
-    return render_template('processes_threads.html')
+    return _RENDERED_PAGES['processes_threads.html']
 
 @app.route('/io_management')
 def io_management():
-    return render_template('io_management.html')
+    return _RENDERED_PAGES['io_management.html']
 
 @app.route('/resource_allocation')
 def resource_allocation():
-    return render_template('resource_allocation.html')
+    return _RENDERED_PAGES['resource_allocation.html']
 
 if __name__ == '__main__':
     port = int(os.environ.get("PORT", 5000))
@@ -1,9 +1,13 @@
 from typing import List, Dict, Any
-import copy
+from collections import deque
+import heapq
+import sys
 
 class Process:
     def __init__(self, pid: str, arrival_time: int, burst_time: int, priority: int = 0):
-        self.pid = pid
+        # String IDs are interned so the many Gantt entries for one process share one
+        # object; other IDs are kept as given so API responses echo them unchanged
+        self.pid = sys.intern(pid) if isinstance(pid, str) else pid
         self.arrival_time = arrival_time
         self.burst_time = burst_time
         self.priority = priority
@@ -13,6 +17,10 @@ class Process:
         self.turnaround_time = 0
         self.start_time = None
 
+    def clone(self) -> 'Process':
+        """Return a fresh copy carrying only the constructor-visible state."""
+        return Process(self.pid, self.arrival_time, self.burst_time, self.priority)
+
     def __repr__(self):
         return f"Process(pid={self.pid}, arrival={self.arrival_time}, burst={self.burst_time})"
 
@@ -22,28 +30,37 @@ class Scheduler:
         """First Come First Served scheduling."""
         sorted_processes = sorted(processes, key=lambda p: p.arrival_time)
         current_time = 0
-        gantt_chart = []
+        # One Gantt entry per process, so the chart can be sized up front
+        gantt_chart = [None] * len(sorted_processes)
+        order = [None] * len(sorted_processes)
         completed_processes = []
+        total_waiting = 0
+        total_turnaround = 0
 
-        for process in sorted_processes:
+        for i, process in enumerate(sorted_processes):
             if current_time < process.arrival_time:
                 current_time = process.arrival_time
 
+            completion_time = current_time + process.burst_time
             process.start_time = current_time
-            process.completion_time = current_time + process.burst_time
-            process.turnaround_time = process.completion_time - process.arrival_time
+            process.completion_time = completion_time
+            process.turnaround_time = completion_time - process.arrival_time
             process.waiting_time = process.turnaround_time - process.burst_time
+            total_waiting += process.waiting_time
+            total_turnaround += process.turnaround_time
 
-            gantt_chart.append((process.pid, current_time, process.completion_time))
-            current_time = process.completion_time
+            gantt_chart[i] = (process.pid, current_time, completion_time)
+            order[i] = process.pid
+            current_time = completion_time
             completed_processes.append(process)
 
-        avg_waiting = sum(p.waiting_time for p in completed_processes) / len(completed_processes)
-        avg_turnaround = sum(p.turnaround_time for p in completed_processes) / len(completed_processes)
+        avg_waiting = total_waiting / len(completed_processes)
+        avg_turnaround = total_turnaround / len(completed_processes)
 
         return {
             'processes': completed_processes,
             'gantt_chart': gantt_chart,
+            'order': order,
             'avg_waiting_time': avg_waiting,
             'avg_turnaround_time': avg_turnaround
         }
@@ -51,40 +68,53 @@ class Scheduler:
     @staticmethod
     def sjf(processes: List[Process]) -> Dict[str, Any]:
         """Shortest Job First scheduling (non-preemptive)."""
-        processes_copy = copy.deepcopy(processes)
+        processes_copy = sorted((p.clone() for p in processes), key=lambda p: p.arrival_time)
+        n = len(processes_copy)
         current_time = 0
         completed = []
-        gantt_chart = []
+        gantt_chart = [None] * n
+        order = [None] * n
         ready_queue = []
+        total_waiting = 0
+        total_turnaround = 0
+        next_arrival_idx = 0
 
-        while len(completed) < len(processes_copy):
+        while len(completed) < n:
             # Add arrived processes to ready queue
-            arrived = [p for p in processes_copy if p.arrival_time <= current_time and p not in completed and p not in ready_queue]
-            ready_queue.extend(arrived)
+            while next_arrival_idx < n and processes_copy[next_arrival_idx].arrival_time <= current_time:
+                arrived = processes_copy[next_arrival_idx]
+                # Arrival index breaks ties so Process objects are never compared
+                heapq.heappush(ready_queue, (arrived.burst_time, next_arrival_idx, arrived))
+                next_arrival_idx += 1
 
             if not ready_queue:
-                current_time += 1
+                # CPU is idle: jump straight to the next arrival
+                current_time = processes_copy[next_arrival_idx].arrival_time
                 continue
 
             # Select shortest job
-            ready_queue.sort(key=lambda p: p.burst_time)
-            process = ready_queue.pop(0)
+            process = heapq.heappop(ready_queue)[2]
 
+            completion_time = current_time + process.burst_time
             process.start_time = current_time
-            process.completion_time = current_time + process.burst_time
-            process.turnaround_time = process.completion_time - process.arrival_time
+            process.completion_time = completion_time
+            process.turnaround_time = completion_time - process.arrival_time
             process.waiting_time = process.turnaround_time - process.burst_time
+            total_waiting += process.waiting_time
+            total_turnaround += process.turnaround_time
 
-            gantt_chart.append((process.pid, current_time, process.completion_time))
-            current_time = process.completion_time
+            gantt_chart[len(completed)] = (process.pid, current_time, completion_time)
+            order[len(completed)] = process.pid
+            current_time = completion_time
             completed.append(process)
 
-        avg_waiting = sum(p.waiting_time for p in completed) / len(completed)
-        avg_turnaround = sum(p.turnaround_time for p in completed) / len(completed)
+        avg_waiting = total_waiting / len(completed)
+        avg_turnaround = total_turnaround / len(completed)
 
         return {
             'processes': completed,
             'gantt_chart': gantt_chart,
+            'order': order,
             'avg_waiting_time': avg_waiting,
             'avg_turnaround_time': avg_turnaround
         }
@@ -92,45 +122,58 @@ class Scheduler:
     @staticmethod
     def round_robin(processes: List[Process], time_quantum: int) -> Dict[str, Any]:
         """Round Robin scheduling."""
-        processes_copy = copy.deepcopy(processes)
+        processes_copy = sorted((p.clone() for p in processes), key=lambda p: p.arrival_time)
+        n = len(processes_copy)
         current_time = 0
         gantt_chart = []
-        ready_queue = []
+        order = []
+        ready_queue = deque()
+        next_arrival_idx = 0
+        completed = []
+        total_waiting = 0
+        total_turnaround = 0
 
-        while any(p.remaining_time > 0 for p in processes_copy):
+        while len(completed) < n:
             # Add arrived processes
-            arrived = [p for p in processes_copy if p.arrival_time <= current_time and p.remaining_time > 0 and p not in ready_queue]
-            ready_queue.extend(arrived)
+            while next_arrival_idx < n and processes_copy[next_arrival_idx].arrival_time <= current_time:
+                ready_queue.append(processes_copy[next_arrival_idx])
+                next_arrival_idx += 1
 
             if not ready_queue:
-                current_time += 1
+                # CPU is idle: jump straight to the next arrival
+                current_time = processes_copy[next_arrival_idx].arrival_time
                 continue
 
-            process = ready_queue.pop(0)
+            process = ready_queue.popleft()
             start_time = current_time
             execute_time = min(time_quantum, process.remaining_time)
             current_time += execute_time
             process.remaining_time -= execute_time
 
             gantt_chart.append((process.pid, start_time, current_time))
+            order.append(process.pid)
 
             if process.remaining_time > 0:
-                # Re-add to queue if not finished
-                later_arrivals = [p for p in processes_copy if p.arrival_time <= current_time and p.remaining_time > 0 and p != process and p not in ready_queue]
-                ready_queue.extend(later_arrivals)
+                # Re-add to queue if not finished, behind anything that arrived meanwhile
+                while next_arrival_idx < n and processes_copy[next_arrival_idx].arrival_time <= current_time:
+                    ready_queue.append(processes_copy[next_arrival_idx])
+                    next_arrival_idx += 1
                 ready_queue.append(process)
             else:
                 process.completion_time = current_time
                 process.turnaround_time = current_time - process.arrival_time
                 process.waiting_time = process.turnaround_time - process.burst_time
+                total_waiting += process.waiting_time
+                total_turnaround += process.turnaround_time
+                completed.append(process)
 
-        completed_processes = [p for p in processes_copy if p.remaining_time == 0]
-        avg_waiting = sum(p.waiting_time for p in completed_processes) / len(completed_processes)
-        avg_turnaround = sum(p.turnaround_time for p in completed_processes) / len(completed_processes)
+        avg_waiting = total_waiting / len(completed)
+        avg_turnaround = total_turnaround / len(completed)
 
         return {
-            'processes': completed_processes,
+            'processes': completed,
             'gantt_chart': gantt_chart,
+            'order': order,
             'avg_waiting_time': avg_waiting,
             'avg_turnaround_time': avg_turnaround
         }
@@ -138,40 +181,59 @@ class Scheduler:
     @staticmethod
     def priority_scheduling(processes: List[Process]) -> Dict[str, Any]:
         """Priority scheduling (non-preemptive)."""
-        processes_copy = copy.deepcopy(processes)
+        processes_copy = sorted((p.clone() for p in processes), key=lambda p: p.arrival_time)
+        n = len(processes_copy)
         current_time = 0
         completed = []
-        gantt_chart = []
+        gantt_chart = [None] * n
+        order = [None] * n
         ready_queue = []
+        total_waiting = 0
+        total_turnaround = 0
+        next_arrival_idx = 0
 
-        while len(completed) < len(processes_copy):
+        while len(completed) < n:
             # Add arrived processes
-            arrived = [p for p in processes_copy if p.arrival_time <= current_time and p not in completed and p not in ready_queue]
-            ready_queue.extend(arrived)
+            while next_arrival_idx < n and processes_copy[next_arrival_idx].arrival_time <= current_time:
+                arrived = processes_copy[next_arrival_idx]
+                # Arrival index breaks ties so Process objects are never compared
+                heapq.heappush(ready_queue, (arrived.priority, next_arrival_idx, arrived))
+                next_arrival_idx += 1
 
             if not ready_queue:
-                current_time += 1
+                # CPU is idle: jump straight to the next arrival
+                current_time = processes_copy[next_arrival_idx].arrival_time
                 continue
 
             # Select highest priority (lowest number)
-            ready_queue.sort(key=lambda p: p.priority)
-            process = ready_queue.pop(0)
+            process = heapq.heappop(ready_queue)[2]
 
+            completion_time = current_time + process.burst_time
             process.start_time = current_time
-            process.completion_time = current_time + process.burst_time
-            process.turnaround_time = process.completion_time - process.arrival_time
+            process.completion_time = completion_time
+            process.turnaround_time = completion_time - process.arrival_time
             process.waiting_time = process.turnaround_time - process.burst_time
+            total_waiting += process.waiting_time
+            total_turnaround += process.turnaround_time
 
-            gantt_chart.append((process.pid, current_time, process.completion_time))
-            current_time = process.completion_time
+            gantt_chart[len(completed)] = (process.pid, current_time, completion_time)
+            order[len(completed)] = process.pid
+            current_time = completion_time
             completed.append(process)
 
-        avg_waiting = sum(p.waiting_time for p in completed) / len(completed)
-        avg_turnaround = sum(p.turnaround_time for p in completed) / len(completed)
+        avg_waiting = total_waiting / len(completed)
+        avg_turnaround = total_turnaround / len(completed)
 
         return {
             'processes': completed,
             'gantt_chart': gantt_chart,
+            'order': order,
             'avg_waiting_time': avg_waiting,
             'avg_turnaround_time': avg_turnaround
-        }
\ No newline at end of file
+        }
+
+# Module-level aliases so callers can bind the schedulers directly
+fcfs = Scheduler.fcfs
+sjf = Scheduler.sjf
+round_robin = Scheduler.round_robin
+priority_scheduling = Scheduler.priority_scheduling
@@ -3,85 +3,184 @@ from PyQt6.QtWidgets import (
     QTableWidget, QTableWidgetItem, QComboBox, QSpinBox,
     QLineEdit, QMessageBox, QGroupBox, QFormLayout
 )
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QPainter, QColor, QFont, QPen
+from PyQt6.QtCore import Qt, QTimer, QRect, QRectF, QPoint, QLine
+from PyQt6.QtGui import QPainter, QColor, QFont, QFontMetrics, QPen, QPixmap, QStaticText
 from gui.components.base_visualizer import BaseVisualizer
 from .algorithms import Process, Scheduler
 
 class GanttChartWidget(QWidget):
+    COLORS = (QColor(255, 100, 100), QColor(100, 255, 100), QColor(100, 100, 255),
+              QColor(255, 255, 100), QColor(255, 100, 255), QColor(100, 255, 255))
+    PEN_AXIS = QPen(Qt.GlobalColor.black, 2)
+    PEN_BOX = QPen(Qt.GlobalColor.black, 1)
+    PEN_TEXT = QPen(Qt.GlobalColor.black)
+
     def __init__(self):
         super().__init__()
+        self._label_font = QFont("Arial", 8)  # QFont needs the QApplication, so not at class scope
+        # drawStaticText positions by the top-left corner rather than the baseline
+        self._label_ascent = QFontMetrics(self._label_font).ascent()
+        self._static_labels = {}  # pid -> QStaticText, so label layout is done once per pid
         self.gantt_data = []  # List of (pid, start, end)
+        self._data_key = ()  # Snapshot of gantt_data, to skip no-op set_data calls
         self.max_time = 0
+        self._bars = []  # (rect, color, label, label_point) per Gantt entry
+        self._row_labels = []  # (point, label) for the row labels on the left
+        self._cache = None  # Rendered chart, rebuilt after set_data, a resize or a DPR change
         self.setMinimumHeight(200)
+        # We paint the background ourselves, so Qt can skip the pre-erase
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
 
     def set_data(self, gantt_data):
+        # Snapshot as a tuple so in-place edits to the caller's list are still noticed
+        data_key = tuple(gantt_data)
+        old_data, old_max = self._data_key, self.max_time
+        if data_key == old_data:
+            return
+        self._data_key = data_key
+
+        old_rect = self._chart_rect()
         self.gantt_data = gantt_data
         self.max_time = max((end for _, _, end in gantt_data), default=0)
-        self.update()
+        self._layout()
+        self._cache = None
+
+        n = len(old_data)
+        if n and self.max_time == old_max and data_key[:n] == old_data:
+            # Only the tail changed and the time scale is the same: repaint just the new bars
+            dirty = self._tail_rect(n)
+        else:
+            # Repaint whatever the old and new charts cover
+            dirty = old_rect.united(self._chart_rect())
+        if not dirty.isEmpty():
+            self.update(dirty)
+
+    def _chart_rect(self):
+        """Bounding rect of everything the current chart draws."""
+        if not self._bars:
+            return QRect()
+        chart_height = self.height() - 60
+        dirty = QRect(0, chart_height - 5, self.width(), 30)  # Time axis and labels
+        for rect, _, _, _ in self._bars:
+            dirty = dirty.united(rect.adjusted(0, 0, 1, 1))
+        for point, _ in self._row_labels:
+            dirty = dirty.united(QRect(0, point.y(), 50, 30))
+        return dirty
+
+    def _layout(self):
+        """Precompute the bar geometry and row labels for the current width."""
+        self._bars = []
+        self._row_labels = []
+        if not self.gantt_data or self.max_time == 0:
+            return
+
+        colors = self.COLORS
+        scale = (self.width() - 70) / self.max_time  # Pixels per time unit
+        text_offset = 20 - self._label_ascent
+
+        y_offset = 20
+        process_row = {}  # pid -> (y, color, label), assigned in order of first appearance
+        current_y = y_offset
+
+        for pid, start, end in self.gantt_data:
+            if pid not in process_row:
+                if pid not in self._static_labels:
+                    self._static_labels[pid] = QStaticText(pid)
+                label = self._static_labels[pid]
+                process_row[pid] = (current_y, colors[len(process_row) % len(colors)], label)
+                self._row_labels.append((QPoint(10, current_y + text_offset), label))
+                current_y += 40
+
+            y, color, label = process_row[pid]
+            x_start = 50 + start * scale
+            x_end = 50 + end * scale
+            rect_width = x_end - x_start
+
+            rect = QRect(int(x_start), y, int(rect_width), 30)
+            label_point = QPoint(int(x_start + rect_width/2 - 10), y + text_offset)
+            self._bars.append((rect, color, label, label_point))
+
+    def _tail_rect(self, start_index):
+        """Bounding rect of the bars (and any new row labels) from start_index on."""
+        dirty = QRect()
+        for rect, _, _, _ in self._bars[start_index:]:
+            dirty = dirty.united(rect.adjusted(0, 0, 1, 1))
+        # QStaticText is not hashable, but each pid's label is a single shared object
+        seen = {id(label) for _, _, label, _ in self._bars[:start_index]}
+        for point, label in self._row_labels:
+            if id(label) not in seen:
+                dirty = dirty.united(QRect(0, point.y(), 50, 30))
+        return dirty
+
+    def resizeEvent(self, event):
+        # The bars and cached chart are laid out for the old width
+        self._layout()
+        self._cache = None
+        super().resizeEvent(event)
 
     def paintEvent(self, event):
-        if not self.gantt_data:
+        # Also rebuild when the widget moves to a screen with another pixel ratio
+        dpr = self.devicePixelRatioF()
+        if (self._cache is None or self._cache.devicePixelRatio() != dpr
+                or self._cache.size() != self.size() * dpr):
+            self._render_cache(self.size())
+        # Blit only the exposed part of the cached chart; the source rect is in device pixels
+        rect = event.rect()
+        source = QRectF(rect.x() * dpr, rect.y() * dpr, rect.width() * dpr, rect.height() * dpr)
+        QPainter(self).drawPixmap(QRectF(rect), self._cache, source)
+
+    def _render_cache(self, size):
+        """Rasterize the whole chart into self._cache at the widget's pixel ratio."""
+        dpr = self.devicePixelRatioF()
+        self._cache = QPixmap(size * dpr)
+        self._cache.setDevicePixelRatio(dpr)
+        self._cache.fill(self.palette().window().color())
+
+        if not self._bars:
             return
 
-        painter = QPainter(self)
+        painter = QPainter(self._cache)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        width = self.width()
-        height = self.height()
+        width = size.width()
+        height = size.height()
         chart_height = height - 60  # Leave space for labels
 
-        if self.max_time == 0:
-            return
-
         # Draw time axis
-        painter.setPen(QPen(Qt.GlobalColor.black, 2))
+        painter.setPen(self.PEN_AXIS)
         painter.drawLine(50, chart_height, width - 20, chart_height)
 
         # Draw time labels
-        painter.setFont(QFont("Arial", 8))
-        for t in range(0, self.max_time + 1, max(1, self.max_time // 10)):
-            x = 50 + (t / self.max_time) * (width - 70)
-            painter.drawLine(int(x), chart_height - 5, int(x), chart_height + 5)
-            painter.drawText(int(x) - 10, chart_height + 20, str(t))
+        painter.setFont(self._label_font)
+        scale = (width - 70) / self.max_time  # Pixels per time unit
+        ticks = [(t, int(50 + t * scale))
+                 for t in range(0, self.max_time + 1, max(1, self.max_time // 10))]
+        painter.drawLines([QLine(x, chart_height - 5, x, chart_height + 5) for _, x in ticks])
+        for t, x in ticks:
+            painter.drawText(x - 10, chart_height + 20, str(t))
 
         # Draw processes
-        colors = [QColor(255, 100, 100), QColor(100, 255, 100), QColor(100, 100, 255),
-                 QColor(255, 255, 100), QColor(255, 100, 255), QColor(100, 255, 255)]
-
-        y_offset = 20
-        process_y = {}
-        current_y = y_offset
-
-        for pid, start, end in self.gantt_data:
-            if pid not in process_y:
-                process_y[pid] = current_y
-                current_y += 40
-
-            y = process_y[pid]
-            x_start = 50 + (start / self.max_time) * (width - 70)
-            x_end = 50 + (end / self.max_time) * (width - 70)
-            rect_width = x_end - x_start
-
-            color = colors[hash(pid) % len(colors)]
-            painter.fillRect(int(x_start), y, int(rect_width), 30, color)
-            painter.setPen(QPen(Qt.GlobalColor.black, 1))
-            painter.drawRect(int(x_start), y, int(rect_width), 30)
+        for rect, color, label, label_point in self._bars:
+            painter.fillRect(rect, color)
+            painter.setPen(self.PEN_BOX)
+            painter.drawRect(rect)
 
             # Draw process label
-            painter.setPen(QPen(Qt.GlobalColor.black))
-            painter.drawText(int(x_start + rect_width/2 - 10), y + 20, pid)
+            painter.setPen(self.PEN_TEXT)
+            painter.drawStaticText(label_point, label)
 
         # Draw process labels on left
-        painter.setPen(QPen(Qt.GlobalColor.black))
-        for pid, y in process_y.items():
-            painter.drawText(10, y + 20, pid)
+        painter.setPen(self.PEN_TEXT)
+        for point, label in self._row_labels:
+            painter.drawStaticText(point, label)
+        painter.end()
 
 class CPUSchedulingVisualizer(BaseVisualizer):
     def __init__(self):
         self.gantt_chart = GanttChartWidget()  # Create before super().__init__
         super().__init__("CPU Scheduling")
         self.processes = []
+        self._pids = set()  # PIDs in self.processes, for duplicate checks
         self.current_algorithm = "FCFS"
         self.time_quantum = 2
         self.animation_timer = QTimer()
@@ -171,12 +270,13 @@ class CPUSchedulingVisualizer(BaseVisualizer):
             priority = self.priority_edit.value()
 
             # Check for duplicate PID
-            if any(p.pid == pid for p in self.processes):
+            if pid in self._pids:
                 QMessageBox.warning(self, "Error", f"Process {pid} already exists")
                 return
 
             process = Process(pid, arrival, burst, priority)
             self.processes.append(process)
+            self._pids.add(pid)
             self.update_process_table()
 
             # Clear inputs
@@ -186,30 +286,40 @@ class CPUSchedulingVisualizer(BaseVisualizer):
             QMessageBox.warning(self, "Error", str(e))
 
     def update_process_table(self):
-        self.process_table.setRowCount(len(self.processes))
-        for i, process in enumerate(self.processes):
-            self.process_table.setItem(i, 0, QTableWidgetItem(process.pid))
-            self.process_table.setItem(i, 1, QTableWidgetItem(str(process.arrival_time)))
-            self.process_table.setItem(i, 2, QTableWidgetItem(str(process.burst_time)))
-            self.process_table.setItem(i, 3, QTableWidgetItem(str(process.priority)))
+        table = self.process_table
+        # Fill the table in one batch: no per-cell signals or repaints
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.setRowCount(len(self.processes))
+            for i, process in enumerate(self.processes):
+                table.setItem(i, 0, QTableWidgetItem(process.pid))
+                table.setItem(i, 1, QTableWidgetItem(str(process.arrival_time)))
+                table.setItem(i, 2, QTableWidgetItem(str(process.burst_time)))
+                table.setItem(i, 3, QTableWidgetItem(str(process.priority)))
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
 
     def on_play(self):
         if not self.processes:
             QMessageBox.warning(self, "Error", "No processes to schedule")
             return
 
+        # The whole chart is shown at once; animate_step is still a no-op, so
+        # don't start animation_timer until step-by-step animation exists
         self.run_scheduling()
-        self.animation_index = 0
-        self.animate_step()
-        self.animation_timer.start(1000)  # 1 second per step
 
     def on_pause(self):
         self.animation_timer.stop()
 
     def on_reset(self):
         self.animation_timer.stop()
+        # Let Qt coalesce the chart and label changes into one repaint
+        self.setUpdatesEnabled(False)
         self.gantt_chart.set_data([])
         self.results_label.setText("")
+        self.setUpdatesEnabled(True)
         self.update_status("Reset")
 
     def run_scheduling(self):
@@ -225,8 +335,13 @@ class CPUSchedulingVisualizer(BaseVisualizer):
             else:
                 raise ValueError("Unknown algorithm")
 
-            self.gantt_chart.set_data(result['gantt_chart'])
-            self.display_results(result)
+            # Let Qt coalesce the chart and results changes into one repaint
+            self.setUpdatesEnabled(False)
+            try:
+                self.gantt_chart.set_data(result['gantt_chart'])
+                self.display_results(result)
+            finally:
+                self.setUpdatesEnabled(True)
             self.update_status("Scheduling completed")
 
         except Exception as e:
@@ -1,17 +1,22 @@
 from typing import List, Dict, Set, Tuple, Any
-import copy
+import functools
+from operator import add, gt, le, sub
 
 class Process:
+    __slots__ = ('pid', 'max_resources', 'allocated_resources', 'need_resources')
+
     def __init__(self, pid: str, max_resources: List[int], allocated_resources: List[int] = None):
         self.pid = pid
         self.max_resources = max_resources  # Maximum resources needed
         self.allocated_resources = allocated_resources or [0] * len(max_resources)  # Currently allocated
-        self.need_resources = [max_r - alloc for max_r, alloc in zip(max_resources, self.allocated_resources)]
+        self.need_resources = list(map(sub, max_resources, self.allocated_resources))
 
     def __repr__(self):
         return f"Process(pid={self.pid}, max={self.max_resources}, allocated={self.allocated_resources}, need={self.need_resources})"
 
 class Resource:
+    __slots__ = ('rid', 'total_instances', 'available_instances')
+
     def __init__(self, rid: str, total_instances: int):
         self.rid = rid
         self.total_instances = total_instances
@@ -20,6 +25,41 @@ class Resource:
     def __repr__(self):
         return f"Resource(rid={self.rid}, total={self.total_instances}, available={self.available_instances})"
 
+class ProcessTable:
+    """Struct-of-arrays snapshot of a process list: one tuple per column, one row per process."""
+    def __init__(self, processes: List[Process]):
+        self.pids = tuple(p.pid for p in processes)
+        self.max = tuple(tuple(p.max_resources) for p in processes)
+        self.alloc = tuple(tuple(p.allocated_resources) for p in processes)
+        self.need = tuple(tuple(p.need_resources) for p in processes)
+
+    @classmethod
+    def from_legacy(cls, processes: List[Process], resources: List[Resource]) -> Tuple['ProcessTable', Tuple[int, ...]]:
+        """Build the table plus the available vector from Process/Resource lists."""
+        return cls(processes), tuple(r.available_instances for r in resources)
+
+@functools.lru_cache(maxsize=4096)
+def _safe_sequence(pids: Tuple[str, ...], needs: Tuple[Tuple[int, ...], ...],
+                   allocations: Tuple[Tuple[int, ...], ...], work: Tuple[int, ...]):
+    """Safety check on a hashable snapshot of the state; returns the safe sequence or None."""
+    work = list(work)
+    # Unfinished process indices in their original order; finished ones are removed
+    pending = list(range(len(pids)))
+    safe_sequence = []
+
+    while pending:
+        # First pending process whose whole need fits in work
+        k = next((k for k, i in enumerate(pending) if all(map(le, needs[i], work))), None)
+        if k is None:
+            return None
+
+        # Can allocate
+        i = pending.pop(k)
+        work = list(map(add, work, allocations[i]))
+        safe_sequence.append(pids[i])
+
+    return tuple(safe_sequence)
+
 class DeadlockAlgorithms:
     @staticmethod
     def bankers_algorithm(processes: List[Process], resources: List[Resource]) -> Dict[str, Any]:
@@ -27,31 +67,19 @@ class DeadlockAlgorithms:
         Banker's algorithm for deadlock avoidance.
         Returns whether the system is in safe state and a safe sequence if safe.
         """
-        work = [r.available_instances for r in resources]
-        finish = [False] * len(processes)
-        safe_sequence = []
-
-        while len(safe_sequence) < len(processes):
-            found = False
-            for i, process in enumerate(processes):
-                if not finish[i] and all(need <= work[j] for j, need in enumerate(process.need_resources)):
-                    # Can allocate
-                    for j in range(len(work)):
-                        work[j] += process.allocated_resources[j]
-                    finish[i] = True
-                    safe_sequence.append(process.pid)
-                    found = True
-                    break
-            if not found:
-                return {
-                    'safe': False,
-                    'safe_sequence': None,
-                    'message': 'System is not in safe state - potential deadlock'
-                }
+        table, available = ProcessTable.from_legacy(processes, resources)
+        # Identical states (e.g. retried what-if requests) are answered from the cache
+        safe_sequence = _safe_sequence(table.pids, table.need, table.alloc, available)
+        if safe_sequence is None:
+            return {
+                'safe': False,
+                'safe_sequence': None,
+                'message': 'System is not in safe state - potential deadlock'
+            }
 
         return {
             'safe': True,
-            'safe_sequence': safe_sequence,
+            'safe_sequence': list(safe_sequence),
             'message': 'System is in safe state'
         }
 
@@ -61,31 +89,51 @@ class DeadlockAlgorithms:
         Detect deadlock using wait-for graph.
         wait_for_graph: {process: [processes it waits for]}
         """
-        # Simple cycle detection using DFS
-        def has_cycle(node, visited, rec_stack):
-            visited.add(node)
-            rec_stack.add(node)
-
-            for neighbor in wait_for_graph.get(node, []):
-                if neighbor not in visited:
-                    if has_cycle(neighbor, visited, rec_stack):
-                        return True
-                elif neighbor in rec_stack:
-                    return True
-
-            rec_stack.remove(node)
-            return False
-
-        visited = set()
-        rec_stack = set()
+        # Tarjan's strongly connected components with an explicit stack, so deep
+        # graphs cannot hit the recursion limit. Every process on a cycle is deadlocked.
+        index = {}
+        lowlink = {}
+        scc_stack = []
+        on_stack = set()
         deadlocked_processes = []
 
-        for process in wait_for_graph:
-            if process not in visited:
-                if has_cycle(process, visited, rec_stack):
-                    # Find the cycle (simplified)
-                    deadlocked_processes = list(rec_stack)
-                    break
+        for root in wait_for_graph:
+            if root in index:
+                continue
+            index[root] = lowlink[root] = len(index)
+            scc_stack.append(root)
+            on_stack.add(root)
+            dfs_stack = [(root, iter(wait_for_graph.get(root, [])))]
+
+            while dfs_stack:
+                node, neighbors = dfs_stack[-1]
+                for neighbor in neighbors:
+                    if neighbor not in index:
+                        # Descend into the unvisited neighbor
+                        index[neighbor] = lowlink[neighbor] = len(index)
+                        scc_stack.append(neighbor)
+                        on_stack.add(neighbor)
+                        dfs_stack.append((neighbor, iter(wait_for_graph.get(neighbor, []))))
+                        break
+                    if neighbor in on_stack:
+                        lowlink[node] = min(lowlink[node], index[neighbor])
+                else:
+                    # All neighbors done: finish node
+                    dfs_stack.pop()
+                    if dfs_stack:
+                        parent = dfs_stack[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = scc_stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        # A component is a cycle if it has several processes or a self-wait
+                        if len(component) > 1 or node in wait_for_graph.get(node, []):
+                            deadlocked_processes.extend(reversed(component))
 
         return {
             'deadlock_detected': len(deadlocked_processes) > 0,
@@ -99,12 +147,13 @@ class DeadlockAlgorithms:
         Detect deadlock using resource allocation graph.
         Simplified: check if any process needs more than available.
         """
-        available = [r.available_instances for r in resources]
-        deadlocked = []
-
-        for process in processes:
-            if any(need > avail for need, avail in zip(process.need_resources, available)):
-                deadlocked.append(process.pid)
+        table, available = ProcessTable.from_legacy(processes, resources)
+        # Common case: the largest single need fits in the scarcest resource, so nobody is blocked
+        if max((max(need, default=0) for need in table.need), default=0) <= min(available, default=0):
+            deadlocked = []
+        else:
+            deadlocked = [pid for pid, need in zip(table.pids, table.need)
+                          if any(map(gt, need, available))]
 
         return {
             'deadlock_detected': len(deadlocked) > 0,
@@ -129,23 +178,20 @@ class DeadlockAlgorithms:
         if any(req > avail for req, avail in zip(request, [r.available_instances for r in resources])):
             return {'granted': False, 'message': "Request exceeds available resources"}
 
-        # Temporarily allocate
-        temp_processes = copy.deepcopy(processes)
-        temp_resources = copy.deepcopy(resources)
-        temp_proc = next(p for p in temp_processes if p.pid == process_id)
+        # Tentatively allocate in place
         for i, req in enumerate(request):
-            temp_proc.allocated_resources[i] += req
-            temp_proc.need_resources[i] -= req
-            temp_resources[i].available_instances -= req
+            process.allocated_resources[i] += req
+            process.need_resources[i] -= req
+            resources[i].available_instances -= req
 
         # Check if still safe
-        result = DeadlockAlgorithms.bankers_algorithm(temp_processes, temp_resources)
+        result = DeadlockAlgorithms.bankers_algorithm(processes, resources)
         if result['safe']:
-            # Actually allocate
-            for i, req in enumerate(request):
-                process.allocated_resources[i] += req
-                process.need_resources[i] -= req
-                resources[i].available_instances -= req
             return {'granted': True, 'message': "Request granted"}
-        else:
-            return {'granted': False, 'message': "Request would lead to unsafe state"}
\ No newline at end of file
+
+        # Roll the tentative allocation back
+        for i, req in enumerate(request):
+            process.allocated_resources[i] -= req
+            process.need_resources[i] += req
+            resources[i].available_instances += req
+        return {'granted': False, 'message': "Request would lead to unsafe state"}
\ No newline at end of file
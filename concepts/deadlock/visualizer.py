@@ -4,20 +4,66 @@ from PyQt6.QtWidgets import (
     QLineEdit, QMessageBox, QGroupBox, QFormLayout, QTextEdit,
     QSplitter, QFrame
 )
-from PyQt6.QtCore import Qt, QPointF, QTimer
-from PyQt6.QtGui import QPainter, QColor, QFont, QPen, QBrush
+from PyQt6.QtCore import Qt, QPointF, QLineF, QRectF, QTimer
+from PyQt6.QtGui import QPainter, QPainterPath, QPolygonF, QColor, QFont, QPen, QBrush, QPixmap, QImage
 from gui.components.base_visualizer import BaseVisualizer
 from .algorithms import Process, Resource, DeadlockAlgorithms
 import math
 
+ARROW_SIZE = 10
+COS_30 = math.cos(math.pi / 6)
+SIN_30 = math.sin(math.pi / 6)
+NODE_PAD = 2
+NODE_PIX_SIZE = 40 + 2 * NODE_PAD
+
 class GraphWidget(QWidget):
     def __init__(self, graph_type="rag"):
         super().__init__()
         self.graph_type = graph_type  # "rag" or "wait_for"
         self.nodes = []  # List of (id, x, y, type) where type is 'process' or 'resource'
         self.edges = []  # List of (from_id, to_id, label)
+        self._node_index = {}  # id -> node tuple, for edge endpoint lookups
+        # Painting resources, built once instead of per edge/node
+        self._pen_solid = QPen(Qt.GlobalColor.blue, 2)
+        self._pen_dash = QPen(Qt.GlobalColor.blue, 2, Qt.PenStyle.DashLine)
+        self._pen_black = QPen(Qt.GlobalColor.black, 2)
+        self._pen_text = QPen(Qt.GlobalColor.black)
+        self._brush_blue = QBrush(Qt.GlobalColor.blue)
+        self._brush_proc = QBrush(QColor(100, 200, 100))
+        self._brush_res = QBrush(QColor(200, 100, 100))
+        self._font = QFont("Arial", 10, QFont.Weight.Bold)
+        # Node circles rendered once per pixel ratio; each node is then a single pixmap blit
+        self._node_dpr = None
+        self._proc_pix = None
+        self._res_pix = None
+        self._cache_pix = None  # Rendered graph, rebuilt after set_data, a resize or a DPR change
+        self._cache_dirty = True
         self.setMinimumSize(400, 300)
 
+    def _node_pixmap(self, brush, dpr):
+        """A transparent pixmap holding one unlabelled node circle, rendered at dpr."""
+        # Padded by the pen half-width so the outline is not clipped
+        side = math.ceil(NODE_PIX_SIZE * dpr)
+        pixmap = QPixmap(side, side)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(self._pen_black)
+        painter.setBrush(brush)
+        painter.drawEllipse(NODE_PAD, NODE_PAD, 40, 40)
+        painter.end()
+        return pixmap
+
+    @staticmethod
+    def _circle_layout(n, center_x, center_y, radius):
+        """Evenly spaced (x, y) points on a circle, starting at angle 0."""
+        if n == 0:
+            return []
+        step = 2 * math.pi / n
+        cos, sin = math.cos, math.sin
+        return [(center_x + radius * cos(i * step), center_y + radius * sin(i * step)) for i in range(n)]
+
     def set_data(self, processes, resources, wait_for_graph=None):
         self.nodes = []
         self.edges = []
@@ -30,33 +76,25 @@ class GraphWidget(QWidget):
             radius = min(center_x, center_y) - 50
 
             # Place processes in a circle
-            for i, process in enumerate(processes):
-                angle = 2 * math.pi * i / num_processes
-                x = center_x + radius * math.cos(angle)
-                y = center_y + radius * math.sin(angle)
-                self.nodes.append((process.pid, x, y, 'process'))
+            points = self._circle_layout(num_processes, center_x, center_y, radius)
+            self.nodes.extend((process.pid, x, y, 'process') for process, (x, y) in zip(processes, points))
 
             # Place resources in inner circle
             inner_radius = radius * 0.6
-            for i, resource in enumerate(resources):
-                angle = 2 * math.pi * i / num_resources
-                x = center_x + inner_radius * math.cos(angle)
-                y = center_y + inner_radius * math.sin(angle)
-                self.nodes.append((resource.rid, x, y, 'resource'))
+            points = self._circle_layout(num_resources, center_x, center_y, inner_radius)
+            self.nodes.extend((resource.rid, x, y, 'resource') for resource, (x, y) in zip(resources, points))
+
+            rids = [r.rid for r in resources]
 
             # Add allocation edges (process -> resource)
-            for process in processes:
-                for i, alloc in enumerate(process.allocated_resources):
-                    if alloc > 0:
-                        resource_id = resources[i].rid
-                        self.edges.append((process.pid, resource_id, f"alloc:{alloc}"))
+            self.edges.extend((process.pid, rid, f"alloc:{alloc}")
+                              for process in processes
+                              for rid, alloc in zip(rids, process.allocated_resources) if alloc > 0)
 
             # Add request edges (process -> resource, dashed)
-            for process in processes:
-                for i, need in enumerate(process.need_resources):
-                    if need > 0:
-                        resource_id = resources[i].rid
-                        self.edges.append((process.pid, resource_id, f"req:{need}"))
+            self.edges.extend((process.pid, rid, f"req:{need}")
+                              for process in processes
+                              for rid, need in zip(rids, process.need_resources) if need > 0)
 
         elif self.graph_type == "wait_for" and wait_for_graph:
             # Wait-for Graph
@@ -65,40 +103,64 @@ class GraphWidget(QWidget):
             radius = min(center_x, center_y) - 50
 
             # Place processes in a circle
-            for i, pid in enumerate(wait_for_graph.keys()):
-                angle = 2 * math.pi * i / num_processes
-                x = center_x + radius * math.cos(angle)
-                y = center_y + radius * math.sin(angle)
-                self.nodes.append((pid, x, y, 'process'))
+            points = self._circle_layout(num_processes, center_x, center_y, radius)
+            self.nodes.extend((pid, x, y, 'process') for pid, (x, y) in zip(wait_for_graph, points))
 
             # Add wait-for edges
             for pid, waits_for in wait_for_graph.items():
                 for target in waits_for:
                     self.edges.append((pid, target, ""))
 
+        self._node_index = {n[0]: n for n in self.nodes}
+        self._cache_dirty = True
         self.update()
 
+    def resizeEvent(self, event):
+        self._cache_dirty = True
+        super().resizeEvent(event)
+
     def paintEvent(self, event):
-        painter = QPainter(self)
+        dpr = self.devicePixelRatioF()
+        if self._cache_dirty or self._cache_pix is None or self._cache_pix.devicePixelRatio() != dpr:
+            self._render_cache()
+        # Moves and overlapping windows only need the cached graph blitted back;
+        # the source rect is in the cache's device pixels
+        rect = event.rect()
+        source = QRectF(rect.x() * dpr, rect.y() * dpr, rect.width() * dpr, rect.height() * dpr)
+        QPainter(self).drawPixmap(QRectF(rect), self._cache_pix, source)
+
+    def _render_cache(self):
+        """Rasterize the edges and nodes into self._cache_pix at the widget's pixel ratio."""
+        # Premultiplied ARGB is the format QPainter's raster engine renders fastest
+        dpr = self.devicePixelRatioF()
+        image = QImage(self.size() * dpr, QImage.Format.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(dpr)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # Draw edges first
+        self._paint_graph(painter)
+        painter.end()
+        self._cache_pix = QPixmap.fromImage(image)
+        self._cache_dirty = False
+
+    def _paint_graph(self, painter):
+        """Draw the edges, edge labels and nodes with the given painter."""
+        # Work out the edge geometry first, grouped by pen style, so each
+        # style is drawn with one drawLines/drawPath call
+        solid_lines, dash_lines = [], []
+        solid_arrows, dash_arrows = QPainterPath(), QPainterPath()
+        labels = []
         for from_id, to_id, label in self.edges:
-            from_node = next((n for n in self.nodes if n[0] == from_id), None)
-            to_node = next((n for n in self.nodes if n[0] == to_id), None)
+            from_node = self._node_index.get(from_id)
+            to_node = self._node_index.get(to_id)
             if from_node and to_node:
                 from_x, from_y = from_node[1], from_node[2]
                 to_x, to_y = to_node[1], to_node[2]
 
-                # Draw arrow
-                painter.setPen(QPen(Qt.GlobalColor.blue, 2))
-                if "req:" in label:
-                    painter.setPen(QPen(Qt.GlobalColor.blue, 2, Qt.PenStyle.DashLine))
-
                 # Calculate arrow
                 dx = to_x - from_x
                 dy = to_y - from_y
-                length = math.sqrt(dx**2 + dy**2)
+                length = math.hypot(dx, dy)
                 if length > 0:
                     dx /= length
                     dy /= length
@@ -110,37 +172,53 @@ class GraphWidget(QWidget):
                 end_x = to_x - dx * node_radius
                 end_y = to_y - dy * node_radius
 
-                painter.drawLine(int(start_x), int(start_y), int(end_x), int(end_y))
+                dashed = "req:" in label
+                (dash_lines if dashed else solid_lines).append(QLineF(start_x, start_y, end_x, end_y))
 
-                # Draw arrowhead
-                arrow_size = 10
-                angle = math.atan2(dy, dx)
-                painter.setBrush(QBrush(Qt.GlobalColor.blue))
-                points = [
+                # Arrowhead: the edge direction rotated by +/-30 degrees, without trig calls
+                ux, uy = (dx, dy) if length > 0 else (1.0, 0.0)
+                back_x = ARROW_SIZE * ux * COS_30
+                back_y = ARROW_SIZE * uy * COS_30
+                side_x = ARROW_SIZE * uy * SIN_30
+                side_y = ARROW_SIZE * ux * SIN_30
+                (dash_arrows if dashed else solid_arrows).addPolygon(QPolygonF([
                     QPointF(end_x, end_y),
-                    QPointF(end_x - arrow_size * math.cos(angle - math.pi/6), end_y - arrow_size * math.sin(angle - math.pi/6)),
-                    QPointF(end_x - arrow_size * math.cos(angle + math.pi/6), end_y - arrow_size * math.sin(angle + math.pi/6))
-                ]
-                painter.drawPolygon(points)
+                    QPointF(end_x - back_x - side_x, end_y - back_y + side_y),
+                    QPointF(end_x - back_x + side_x, end_y - back_y - side_y),
+                    QPointF(end_x, end_y)
+                ]))
 
-                # Draw label
                 if label:
                     mid_x = (start_x + end_x) / 2
                     mid_y = (start_y + end_y) / 2
-                    painter.setPen(QPen(Qt.GlobalColor.black))
-                    painter.drawText(int(mid_x - 20), int(mid_y - 5), label)
+                    labels.append((int(mid_x - 20), int(mid_y - 5), label))
+
+        # Draw edges first
+        painter.setBrush(self._brush_blue)
+        for pen, lines, arrows in ((self._pen_solid, solid_lines, solid_arrows),
+                                   (self._pen_dash, dash_lines, dash_arrows)):
+            if lines:
+                painter.setPen(pen)
+                painter.drawLines(lines)
+                painter.drawPath(arrows)
+
+        # Draw edge labels
+        painter.setPen(self._pen_text)
+        for x, y, label in labels:
+            painter.drawText(x, y, label)
 
         # Draw nodes
+        painter.setFont(self._font)
+        painter.setPen(self._pen_text)
+        dpr = self.devicePixelRatioF()
+        if self._node_dpr != dpr:
+            self._proc_pix = self._node_pixmap(self._brush_proc, dpr)
+            self._res_pix = self._node_pixmap(self._brush_res, dpr)
+            self._node_dpr = dpr
+        offset = 20 + NODE_PAD
         for node_id, x, y, node_type in self.nodes:
-            painter.setPen(QPen(Qt.GlobalColor.black, 2))
-            if node_type == 'process':
-                painter.setBrush(QBrush(QColor(100, 200, 100)))
-            else:
-                painter.setBrush(QBrush(QColor(200, 100, 100)))
-
-            painter.drawEllipse(int(x - 20), int(y - 20), 40, 40)
-            painter.setPen(QPen(Qt.GlobalColor.black))
-            painter.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+            pixmap = self._proc_pix if node_type == 'process' else self._res_pix
+            painter.drawPixmap(int(x - offset), int(y - offset), pixmap)
             painter.drawText(int(x - 10), int(y + 5), node_id)
 
 class DeadlockVisualizer(BaseVisualizer):
@@ -151,6 +229,13 @@ class DeadlockVisualizer(BaseVisualizer):
         self.resources = []
         self.wait_for_graph = {}
         self.current_mode = "bankers"  # bankers, detection, prevention
+        # Coalesces bursts of update_graphs() calls into one rebuild on the next event loop pass
+        self._graph_timer = QTimer()
+        self._graph_timer.setSingleShot(True)
+        self._graph_timer.timeout.connect(self._do_update_graphs)
+        # Whether each graph missed data changes while it was hidden
+        self._rag_stale = True
+        self._wait_for_stale = True
         super().__init__("Deadlock Visualization")
         self.setup_specific_ui()
 
@@ -286,7 +371,10 @@ class DeadlockVisualizer(BaseVisualizer):
         else:
             self.rag_widget.hide()
             self.wait_for_widget.show()
-        self.update_graphs()
+        # Only refresh if the graph just shown missed updates while hidden
+        shown_stale = self._rag_stale if self.wait_for_widget.isHidden() else self._wait_for_stale
+        if shown_stale and not self._graph_timer.isActive():
+            self._graph_timer.start(0)
 
     def add_resource(self):
         try:
@@ -302,7 +390,7 @@ class DeadlockVisualizer(BaseVisualizer):
 
             resource = Resource(rid, total)
             self.resources.append(resource)
-            self.update_tables()
+            self._append_resource_row(resource)
 
             self.resource_id_edit.setText(f"R{len(self.resources) + 1}")
 
@@ -327,7 +415,7 @@ class DeadlockVisualizer(BaseVisualizer):
 
             process = Process(pid, max_resources)
             self.processes.append(process)
-            self.update_tables()
+            self._append_process_row(process)
 
             self.process_id_edit.setText(f"P{len(self.processes) + 1}")
 
@@ -347,7 +435,7 @@ class DeadlockVisualizer(BaseVisualizer):
                 result = DeadlockAlgorithms.simulate_request(self.processes, self.resources, pid, request)
                 self.results_text.append(f"Request by {pid} for {request}: {result['message']}")
                 if result['granted']:
-                    self.update_tables()
+                    self._refresh_dynamic_cells()
                     self.update_graphs()
             else:
                 self.results_text.append("Request simulation only available in Banker's mode")
@@ -371,9 +459,44 @@ class DeadlockVisualizer(BaseVisualizer):
             self.process_table.setItem(i, 2, QTableWidgetItem(str(process.allocated_resources)))
             self.process_table.setItem(i, 3, QTableWidgetItem(str(process.need_resources)))
 
+    def _append_resource_row(self, resource):
+        row = self.resource_table.rowCount()
+        self.resource_table.insertRow(row)
+        self.resource_table.setItem(row, 0, QTableWidgetItem(resource.rid))
+        self.resource_table.setItem(row, 1, QTableWidgetItem(str(resource.total_instances)))
+        self.resource_table.setItem(row, 2, QTableWidgetItem(str(resource.available_instances)))
+
+    def _append_process_row(self, process):
+        row = self.process_table.rowCount()
+        self.process_table.insertRow(row)
+        self.process_table.setItem(row, 0, QTableWidgetItem(process.pid))
+        self.process_table.setItem(row, 1, QTableWidgetItem(str(process.max_resources)))
+        self.process_table.setItem(row, 2, QTableWidgetItem(str(process.allocated_resources)))
+        self.process_table.setItem(row, 3, QTableWidgetItem(str(process.need_resources)))
+
+    def _refresh_dynamic_cells(self):
+        """Update the cells a granted request can change, reusing the existing items."""
+        for row, resource in enumerate(self.resources):
+            self.resource_table.item(row, 2).setText(str(resource.available_instances))
+        for row, process in enumerate(self.processes):
+            self.process_table.item(row, 2).setText(str(process.allocated_resources))
+            self.process_table.item(row, 3).setText(str(process.need_resources))
+
     def update_graphs(self):
-        self.rag_widget.set_data(self.processes, self.resources)
-        self.wait_for_widget.set_data(self.processes, self.resources, self.wait_for_graph)
+        # The data changed, so both graphs are out of date until rebuilt
+        self._rag_stale = True
+        self._wait_for_stale = True
+        if not self._graph_timer.isActive():
+            self._graph_timer.start(0)
+
+    def _do_update_graphs(self):
+        # Rebuild only the stale graph on screen; the hidden one is refreshed when shown
+        if self._rag_stale and not self.rag_widget.isHidden():
+            self.rag_widget.set_data(self.processes, self.resources)
+            self._rag_stale = False
+        if self._wait_for_stale and not self.wait_for_widget.isHidden():
+            self.wait_for_widget.set_data(self.processes, self.resources, self.wait_for_graph)
+            self._wait_for_stale = False
 
     def on_play(self):
         if self.current_mode == "bankers":
@@ -1,7 +1,11 @@
 from typing import List, Dict, Any, Optional
 import copy
+import heapq
+from array import array
 
 class File:
+    __slots__ = ('name', 'size', 'content', 'blocks')
+
     def __init__(self, name: str, size: int, content: str = ""):
         self.name = name
         self.size = size
@@ -9,88 +13,133 @@ class File:
         self.blocks: List[int] = []  # Block indices allocated to this file
 
 class Directory:
+    __slots__ = ('name', 'parent', 'files', 'subdirectories', '_cached_path', '_total_size')
+
     def __init__(self, name: str, parent: Optional['Directory'] = None):
         self.name = name
         self.parent = parent
-        self.files: List[File] = []
-        self.subdirectories: List['Directory'] = []
+        # Keyed by name; dicts keep insertion order, so iterating values() is creation order
+        self.files: Dict[str, File] = {}
+        self.subdirectories: Dict[str, 'Directory'] = {}
+        self._cached_path: Optional[str] = None  # Parents never change, so the path is fixed
+        self._total_size = 0  # Sum of the sizes in self.files
 
     def add_file(self, file: File):
-        self.files.append(file)
+        if file.name in self.files:
+            self._total_size -= self.files[file.name].size
+        self.files[file.name] = file
+        self._total_size += file.size
+
+    def remove_file(self, file: File):
+        if self.files.get(file.name) is file:
+            del self.files[file.name]
+            self._total_size -= file.size
+
+    def get_file(self, name: str) -> Optional[File]:
+        return self.files.get(name)
 
     def add_subdirectory(self, directory: 'Directory'):
-        self.subdirectories.append(directory)
+        self.subdirectories[directory.name] = directory
+
+    def get_subdirectory(self, name: str) -> Optional['Directory']:
+        return self.subdirectories.get(name)
+
+    def total_size(self) -> int:
+        """Total size of the files directly in this directory."""
+        return self._total_size
 
     def get_path(self) -> str:
-        if self.parent is None:
-            return "/"
-        path = self.parent.get_path()
-        return path + self.name + "/" if path != "/" else "/" + self.name + "/"
-
-class DiskBlock:
-    def __init__(self, index: int):
-        self.index = index
-        self.allocated = False
-        self.file: Optional[File] = None
-        self.next_block: Optional[int] = None  # For linked allocation
+        if self._cached_path is None:
+            if self.parent is None:
+                self._cached_path = "/"
+            else:
+                self._cached_path = self.parent.get_path() + self.name + "/"
+        return self._cached_path
 
 class FileSystem:
     def __init__(self, total_blocks: int = 100, block_size: int = 1024):
         self.total_blocks = total_blocks
         self.block_size = block_size
-        self.disk: List[DiskBlock] = [DiskBlock(i) for i in range(total_blocks)]
+        # Disk blocks as parallel arrays, indexed by block number
+        self.allocated = bytearray(total_blocks)  # 1 = allocated, 0 = free
+        self._allocated_count = 0  # Number of 1s in self.allocated
+        self.block_file: List[Optional[File]] = [None] * total_blocks
+        self.next_block: List[Optional[int]] = [None] * total_blocks  # For linked allocation
+        # Min-heap of free block indices. It may hold stale or duplicate entries;
+        # those are skipped by checking the bitmap when popped.
+        self._free_heap = list(range(total_blocks))
         self.root = Directory("")
         self.allocation_method = "contiguous"  # contiguous, linked, indexed
 
     def allocate_contiguous(self, file: File) -> bool:
         """Contiguous allocation: find consecutive free blocks."""
         required_blocks = (file.size + self.block_size - 1) // self.block_size
-        start_block = -1
-        consecutive = 0
-
-        for i, block in enumerate(self.disk):
-            if not block.allocated:
-                if start_block == -1:
-                    start_block = i
-                consecutive += 1
-                if consecutive == required_blocks:
-                    # Allocate blocks
-                    for j in range(start_block, start_block + required_blocks):
-                        self.disk[j].allocated = True
-                        self.disk[j].file = file
-                        file.blocks.append(j)
-                    return True
-            else:
-                start_block = -1
-                consecutive = 0
+        if required_blocks < 1:
+            return False
+
+        # First run of free blocks long enough, found by searching the bitmap
+        start_block = self.allocated.find(bytes(required_blocks))
+        if start_block == -1:
+            return False  # No contiguous space found
+
+        # Allocate blocks
+        for j in range(start_block, start_block + required_blocks):
+            self._claim_block(j, file)
+        return True
 
-        return False  # No contiguous space found
+    def _take_free_blocks(self, count: int) -> Optional[List[int]]:
+        """Pop the count lowest free block indices, or None if there are not enough."""
+        # Disk obviously too full: fail before touching the heap
+        if self.total_blocks - self._allocated_count < count:
+            return None
+
+        taken = []
+        while len(taken) < count and self._free_heap:
+            block_idx = heapq.heappop(self._free_heap)
+            if not self.allocated[block_idx] and (not taken or taken[-1] != block_idx):
+                taken.append(block_idx)
+
+        if len(taken) < count:
+            for block_idx in taken:
+                heapq.heappush(self._free_heap, block_idx)
+            return None
+        return taken
+
+    def _claim_block(self, block_idx: int, file: File):
+        """Mark a block allocated to file and record it in the file's block list."""
+        self.allocated[block_idx] = 1
+        self._allocated_count += 1
+        self.block_file[block_idx] = file
+        file.blocks.append(block_idx)
+
+    def _release_block(self, block_idx: int):
+        """Mark a block free again and return it to the free list."""
+        self.allocated[block_idx] = 0
+        self._allocated_count -= 1
+        self.block_file[block_idx] = None
+        self.next_block[block_idx] = None
+        heapq.heappush(self._free_heap, block_idx)
+        if len(self._free_heap) > 2 * self.total_blocks:
+            # Too many stale entries: rebuild from the bitmap (ascending, so already a heap)
+            self._free_heap = [i for i, used in enumerate(self.allocated) if not used]
 
     def allocate_linked(self, file: File) -> bool:
         """Linked allocation: allocate any free blocks and link them."""
         required_blocks = (file.size + self.block_size - 1) // self.block_size
-        allocated = 0
-        prev_block = -1
+        if required_blocks < 1:
+            return False
 
-        for block in self.disk:
-            if not block.allocated:
-                block.allocated = True
-                block.file = file
-                file.blocks.append(block.index)
-                if prev_block != -1:
-                    self.disk[prev_block].next_block = block.index
-                prev_block = block.index
-                allocated += 1
-                if allocated == required_blocks:
-                    return True
-
-        # If we allocated some but not all, deallocate them
-        for block_idx in file.blocks:
-            self.disk[block_idx].allocated = False
-            self.disk[block_idx].file = None
-            self.disk[block_idx].next_block = None
-        file.blocks.clear()
-        return False
+        blocks = self._take_free_blocks(required_blocks)
+        if blocks is None:
+            return False
+
+        prev_block = -1
+        for block_idx in blocks:
+            self._claim_block(block_idx, file)
+            if prev_block != -1:
+                self.next_block[prev_block] = block_idx
+            prev_block = block_idx
+        return True
 
     def allocate_indexed(self, file: File) -> bool:
         """Indexed allocation: use first block as index."""
@@ -98,33 +147,18 @@ class FileSystem:
         if required_blocks > self.total_blocks - 1:  # Need space for index block too
             return False
 
-        # Find index block
-        index_block = None
-        data_blocks = []
-
-        for block in self.disk:
-            if not block.allocated:
-                if index_block is None:
-                    index_block = block
-                else:
-                    data_blocks.append(block)
-                    if len(data_blocks) == required_blocks:
-                        break
-
-        if len(data_blocks) < required_blocks:
+        # Index block plus data blocks, lowest free indices first
+        blocks = self._take_free_blocks(required_blocks + 1)
+        if blocks is None:
             return False
+        index_block = blocks[0]
 
         # Allocate
-        index_block.allocated = True
-        index_block.file = file
-        file.blocks.append(index_block.index)
-
-        for i, block in enumerate(data_blocks):
-            block.allocated = True
-            block.file = file
-            file.blocks.append(block.index)
+        for block_idx in blocks:
+            self._claim_block(block_idx, file)
+        if len(blocks) > 1:
             # Store data block index in index block (simplified)
-            index_block.next_block = block.index if i == 0 else index_block.next_block
+            self.next_block[index_block] = blocks[1]
 
         return True
 
@@ -135,7 +169,7 @@ class FileSystem:
             return False
 
         # Check if file already exists
-        if any(f.name == name for f in directory.files):
+        if directory.get_file(name) is not None:
             return False
 
         file = File(name, size)
@@ -159,17 +193,15 @@ class FileSystem:
         if directory is None:
             return False
 
-        file = next((f for f in directory.files if f.name == name), None)
+        file = directory.get_file(name)
         if file is None:
             return False
 
         # Deallocate blocks
         for block_idx in file.blocks:
-            self.disk[block_idx].allocated = False
-            self.disk[block_idx].file = None
-            self.disk[block_idx].next_block = None
+            self._release_block(block_idx)
 
-        directory.files.remove(file)
+        directory.remove_file(file)
         return True
 
     def navigate_to_directory(self, path: str) -> Optional[Directory]:
@@ -181,13 +213,8 @@ class FileSystem:
         current = self.root
 
         for part in parts:
-            found = False
-            for subdir in current.subdirectories:
-                if subdir.name == part:
-                    current = subdir
-                    found = True
-                    break
-            if not found:
+            current = current.get_subdirectory(part)
+            if current is None:
                 return None
         return current
 
@@ -197,7 +224,7 @@ class FileSystem:
         if directory is None:
             return False
 
-        if any(d.name == name for d in directory.subdirectories):
+        if directory.get_subdirectory(name) is not None:
             return False
 
         new_dir = Directory(name, directory)
@@ -206,7 +233,7 @@ class FileSystem:
 
     def get_disk_usage(self) -> Dict[str, Any]:
         """Get disk usage statistics."""
-        allocated_blocks = sum(1 for b in self.disk if b.allocated)
+        allocated_blocks = self._allocated_count
         free_blocks = self.total_blocks - allocated_blocks
         return {
             'total_blocks': self.total_blocks,
@@ -219,40 +246,31 @@ class FATFileSystem(FileSystem):
     """Simplified FAT file system simulation."""
     def __init__(self, total_blocks: int = 100):
         super().__init__(total_blocks)
-        self.fat = [-1] * total_blocks  # FAT table: -1 = free, -2 = end of chain
+        # FAT table as packed C ints: -1 = free, -2 = end of chain
+        self.fat = array('i', [-1]) * total_blocks
 
     def allocate_linked(self, file: File) -> bool:
         """FAT-style linked allocation."""
         required_blocks = (file.size + self.block_size - 1) // self.block_size
-        allocated = 0
-        prev_block = -1
+        if required_blocks < 1:
+            return False
 
-        for i, block in enumerate(self.disk):
-            if self.fat[i] == -1:  # Free block
-                if prev_block != -1:
-                    self.fat[prev_block] = i  # Link previous to current
-                else:
-                    file.blocks.append(i)  # First block
-                prev_block = i
-                self.fat[i] = -2  # Mark as end (will be updated if more blocks)
-                block.allocated = True
-                block.file = file
-                allocated += 1
-                if allocated == required_blocks:
-                    break
-
-        if allocated == required_blocks:
-            file.blocks.extend(range(file.blocks[0] + 1, file.blocks[0] + allocated))
-            return True
-        else:
-            # Deallocate
-            for block_idx in file.blocks:
-                self.fat[block_idx] = -1
-                self.disk[block_idx].allocated = False
-                self.disk[block_idx].file = None
-            file.blocks.clear()
+        blocks = self._take_free_blocks(required_blocks)
+        if blocks is None:
             return False
 
+        for block_idx in blocks:
+            self._claim_block(block_idx, file)
+        # Chain the blocks in the FAT: each entry points to the next, the last ends the chain
+        for block_idx, next_idx in zip(blocks, blocks[1:]):
+            self.fat[block_idx] = next_idx
+        self.fat[blocks[-1]] = -2
+        return True
+
+    def _release_block(self, block_idx: int):
+        self.fat[block_idx] = -1
+        super()._release_block(block_idx)
+
 class NTFSFileSystem(FileSystem):
     """Simplified NTFS simulation with MFT."""
     def __init__(self, total_blocks: int = 100):
@@ -4,17 +4,37 @@ from PyQt6.QtWidgets import (
     QComboBox, QSpinBox, QLineEdit, QMessageBox, QGroupBox,
     QFormLayout, QSplitter, QTextEdit, QGridLayout, QFrame
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QRect
 from PyQt6.QtGui import QPainter, QColor, QFont, QPen
 from gui.components.base_visualizer import BaseVisualizer
 from .algorithms import FileSystem, FATFileSystem, NTFSFileSystem, Ext4FileSystem, File, Directory
 
 class DiskVisualizationWidget(QWidget):
+    COLOR_FILE = QColor(255, 100, 100)
+    COLOR_SYSTEM = QColor(100, 100, 255)  # Allocated but not owned by a file
+    COLOR_FREE = QColor(200, 200, 200)
+    MIN_LABEL_BLOCK_SIZE = 14  # Below this the block numbers are unreadable
+
     def __init__(self, file_system: FileSystem):
         super().__init__()
         self.file_system = file_system
+        self._label_font = QFont("Arial", 6)
+        self._pen_outline = QPen(Qt.GlobalColor.black, 1)
+        # Block squares for the current geometry, rebuilt when block size or count changes
+        self._rects_key = None
+        self._block_rects = []
         self.setMinimumHeight(300)
 
+    def _rects_for(self, block_size, total_blocks, blocks_per_row):
+        key = (block_size, total_blocks)
+        if key != self._rects_key:
+            self._block_rects = [
+                QRect(col * block_size, row * block_size, block_size - 2, block_size - 2)
+                for row, col in (divmod(i, blocks_per_row) for i in range(total_blocks))
+            ]
+            self._rects_key = key
+        return self._block_rects
+
     def paintEvent(self, event):
         if not self.file_system:
             return
@@ -27,56 +47,137 @@ class DiskVisualizationWidget(QWidget):
         blocks_per_row = 10
         block_size = min(width // blocks_per_row, height // (self.file_system.total_blocks // blocks_per_row + 1))
 
-        for i, block in enumerate(self.file_system.disk):
-            row = i // blocks_per_row
-            col = i % blocks_per_row
-            x = col * block_size
-            y = row * block_size
-
-            if block.allocated:
-                color = QColor(255, 100, 100) if block.file else QColor(100, 100, 255)
+        # Group the block squares by colour so each colour is one drawRects call
+        fs = self.file_system
+        file_rects, system_rects, free_rects = [], [], []
+        block_rects = self._rects_for(block_size, fs.total_blocks, blocks_per_row)
+        for rect, allocated, block_file in zip(block_rects, fs.allocated, fs.block_file):
+            if not allocated:
+                free_rects.append(rect)
+            elif block_file:
+                file_rects.append(rect)
             else:
-                color = QColor(200, 200, 200)
-
-            painter.fillRect(x, y, block_size - 2, block_size - 2, color)
-            painter.setPen(QPen(Qt.GlobalColor.black, 1))
-            painter.drawRect(x, y, block_size - 2, block_size - 2)
-
-            # Draw block number
-            painter.setFont(QFont("Arial", 6))
-            painter.setPen(QPen(Qt.GlobalColor.black))
-            painter.drawText(x + 2, y + block_size - 4, str(i))
+                system_rects.append(rect)
+
+        painter.setPen(self._pen_outline)
+        for color, rects in ((self.COLOR_FILE, file_rects),
+                             (self.COLOR_SYSTEM, system_rects),
+                             (self.COLOR_FREE, free_rects)):
+            if rects:
+                painter.setBrush(color)
+                painter.drawRects(rects)
+
+        # Draw block numbers, skipped when the blocks are too small to read them
+        if block_size >= self.MIN_LABEL_BLOCK_SIZE:
+            painter.setFont(self._label_font)
+            for i in range(fs.total_blocks):
+                row, col = divmod(i, blocks_per_row)
+                painter.drawText(col * block_size + 2, row * block_size + block_size - 4, str(i))
 
 class DirectoryTreeWidget(QTreeWidget):
     def __init__(self, file_system: FileSystem):
         super().__init__()
         self.file_system = file_system
+        self._dir_items = {}  # id(Directory) -> its QTreeWidgetItem
         self.setHeaderLabel("Directory Structure")
+        # Subdirectory contents are only built when the user expands them
+        self.itemExpanded.connect(self._on_expand)
         self.refresh_tree()
 
     def refresh_tree(self):
         self.clear()
-        self.add_directory_to_tree(self.file_system.root, None)
+        self._dir_items = {}
+        self.add_directory_to_tree(self.file_system.root, None, populate=True)
 
-    def add_directory_to_tree(self, directory: Directory, parent_item):
+    def add_directory_to_tree(self, directory: Directory, parent_item, populate: bool = False):
         item = QTreeWidgetItem([directory.name or "root"])
+        item.setData(0, Qt.ItemDataRole.UserRole, directory)
+        self._dir_items[id(directory)] = item
         if parent_item:
             parent_item.addChild(item)
         else:
             self.addTopLevelItem(item)
 
-        for file in directory.files:
-            file_item = QTreeWidgetItem([f"{file.name} ({file.size} bytes)"])
-            item.addChild(file_item)
+        if populate:
+            self._populate(item, directory)
+        elif directory.files or directory.subdirectories:
+            # Placeholder child (no data) so Qt shows the expand arrow
+            item.addChild(QTreeWidgetItem(["..."]))
 
-        for subdir in directory.subdirectories:
+    def _populate(self, item, directory: Directory):
+        """Add a directory's files and (still unpopulated) subdirectory items."""
+        for file in directory.files.values():
+            item.addChild(self._make_file_item(file))
+
+        for subdir in directory.subdirectories.values():
             self.add_directory_to_tree(subdir, item)
 
+    @staticmethod
+    def _is_unpopulated(item) -> bool:
+        return item.childCount() == 1 and item.child(0).data(0, Qt.ItemDataRole.UserRole) is None
+
+    def _on_expand(self, item):
+        if self._is_unpopulated(item):
+            item.takeChildren()
+            self._populate(item, item.data(0, Qt.ItemDataRole.UserRole))
+
+    def _make_file_item(self, file: File):
+        file_item = QTreeWidgetItem([f"{file.name} ({file.size} bytes)"])
+        file_item.setData(0, Qt.ItemDataRole.UserRole, file)
+        return file_item
+
+    def _forget_subtree(self, item):
+        """Drop a removed directory item and its descendants from the item map."""
+        obj = item.data(0, Qt.ItemDataRole.UserRole)
+        if isinstance(obj, Directory):
+            self._dir_items.pop(id(obj), None)
+            for i in range(item.childCount()):
+                self._forget_subtree(item.child(i))
+
+    def reload_node(self, directory: Directory):
+        """Bring one directory's children in line with the model, touching only what changed."""
+        item = self._dir_items.get(id(directory))
+        if item is None:
+            # Inside a subtree not expanded yet, which will read the current contents
+            return
+
+        if self._is_unpopulated(item):
+            # Not built yet: expanding it later will read the current contents
+            if not (directory.files or directory.subdirectories):
+                item.takeChildren()
+            return
+
+        self.setUpdatesEnabled(False)
+        try:
+            # Remove items whose file/directory is gone
+            current = {id(f) for f in directory.files.values()}
+            current.update(id(d) for d in directory.subdirectories.values())
+            for i in range(item.childCount() - 1, -1, -1):
+                obj = item.child(i).data(0, Qt.ItemDataRole.UserRole)
+                if id(obj) not in current:
+                    self._forget_subtree(item.takeChild(i))
+
+            existing = {id(item.child(i).data(0, Qt.ItemDataRole.UserRole))
+                        for i in range(item.childCount())}
+
+            # Add the new ones, keeping files ahead of subdirectories as refresh_tree does
+            for i, file in enumerate(directory.files.values()):
+                if id(file) not in existing:
+                    item.insertChild(i, self._make_file_item(file))
+            for subdir in directory.subdirectories.values():
+                if id(subdir) not in existing:
+                    self.add_directory_to_tree(subdir, item)
+        finally:
+            self.setUpdatesEnabled(True)
+
 class FileSystemVisualizer(BaseVisualizer):
     def __init__(self):
         self.file_system = FileSystem()
         self.disk_widget = DiskVisualizationWidget(self.file_system)
         self.directory_tree = DirectoryTreeWidget(self.file_system)
+        # Refreshes are coalesced so a burst of operations repaints once
+        self._refresh_pending = False
+        self._dirty_dirs = {}  # id(Directory) -> Directory awaiting reload_node
         super().__init__("File Systems")
         self.setup_specific_ui()
 
@@ -184,6 +285,7 @@ class FileSystemVisualizer(BaseVisualizer):
 
         self.disk_widget.file_system = self.file_system
         self.directory_tree.file_system = self.file_system
+        self._dirty_dirs = {}  # Belong to the old file system; the full rebuild covers them
         self.directory_tree.refresh_tree()
         self.update_disk_usage()
         self.disk_widget.update()
@@ -191,20 +293,21 @@ class FileSystemVisualizer(BaseVisualizer):
     def on_alloc_changed(self, method):
         self.file_system.allocation_method = method
 
+    def _read_form(self):
+        """Read the path, name and size inputs once per operation."""
+        return self.path_edit.text().strip(), self.name_edit.text().strip(), self.size_spin.value()
+
     def create_file(self):
         try:
-            path = self.path_edit.text().strip()
-            name = self.name_edit.text().strip()
-            size = self.size_spin.value()
+            path, name, size = self._read_form()
 
             if not name:
                 QMessageBox.warning(self, "Error", "File name cannot be empty")
                 return
 
-            if self.file_system.create_file(path, name, size):
-                self.directory_tree.refresh_tree()
-                self.disk_widget.update()
-                self.update_disk_usage()
+            fs = self.file_system
+            if fs.create_file(path, name, size):
+                self._schedule_refresh(fs.navigate_to_directory(path))
                 self.update_status(f"Created file: {name}")
             else:
                 QMessageBox.warning(self, "Error", "Failed to create file")
@@ -213,17 +316,15 @@ class FileSystemVisualizer(BaseVisualizer):
 
     def delete_file(self):
         try:
-            path = self.path_edit.text().strip()
-            name = self.name_edit.text().strip()
+            path, name, _ = self._read_form()
 
             if not name:
                 QMessageBox.warning(self, "Error", "File name cannot be empty")
                 return
 
-            if self.file_system.delete_file(path, name):
-                self.directory_tree.refresh_tree()
-                self.disk_widget.update()
-                self.update_disk_usage()
+            fs = self.file_system
+            if fs.delete_file(path, name):
+                self._schedule_refresh(fs.navigate_to_directory(path))
                 self.update_status(f"Deleted file: {name}")
             else:
                 QMessageBox.warning(self, "Error", "Failed to delete file")
@@ -232,21 +333,37 @@ class FileSystemVisualizer(BaseVisualizer):
 
     def create_directory(self):
         try:
-            path = self.path_edit.text().strip()
-            name = self.name_edit.text().strip()
+            path, name, _ = self._read_form()
 
             if not name:
                 QMessageBox.warning(self, "Error", "Directory name cannot be empty")
                 return
 
-            if self.file_system.create_directory(path, name):
-                self.directory_tree.refresh_tree()
+            fs = self.file_system
+            if fs.create_directory(path, name):
+                self._schedule_refresh(fs.navigate_to_directory(path))
                 self.update_status(f"Created directory: {name}")
             else:
                 QMessageBox.warning(self, "Error", "Failed to create directory")
         except Exception as e:
             QMessageBox.warning(self, "Error", str(e))
 
+    def _schedule_refresh(self, directory: Directory):
+        """Queue a tree/disk refresh for the next frame, merging repeated requests."""
+        self._dirty_dirs[id(directory)] = directory
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(16, self._do_refresh)
+
+    def _do_refresh(self):
+        dirty_dirs = self._dirty_dirs.values()
+        self._dirty_dirs = {}
+        for directory in dirty_dirs:
+            self.directory_tree.reload_node(directory)
+        self.disk_widget.update()
+        self.update_disk_usage()
+        self._refresh_pending = False
+
     def update_disk_usage(self):
         usage = self.file_system.get_disk_usage()
         self.usage_label.setText(
@@ -263,73 +380,37 @@ class FileSystemVisualizer(BaseVisualizer):
 
     def on_tree_item_clicked(self, item, column):
         """Show information about selected file or directory."""
-        text = item.text(column)
-        if text.startswith("root"):
-            self.show_directory_info(self.file_system.root)
-        elif " (" in text:  # It's a file
-            file_name = text.split(" (")[0]
-            # Find the file in the directory structure
-            self.show_file_info(file_name)
-        else:  # It's a directory
-            dir_name = text
-            # Find the directory
-            self.show_directory_info_by_name(dir_name)
-
-    def show_file_info(self, file_name):
+        # Each item carries the File/Directory it shows, so same-named entries stay distinct
+        obj = item.data(0, Qt.ItemDataRole.UserRole)
+        if isinstance(obj, Directory):
+            self.show_directory_info(obj)
+        elif obj is not None:
+            self.show_file_info(obj)
+
+    def show_file_info(self, file):
         """Show information about a file."""
-        def find_file(directory, name):
-            for file in directory.files:
-                if file.name == name:
-                    return file
-            for subdir in directory.subdirectories:
-                result = find_file(subdir, name)
-                if result:
-                    return result
-            return None
-
-        file = find_file(self.file_system.root, file_name)
-        if file:
-            info = f"File Name: {file.name}\n"
-            info += f"Size: {file.size} bytes\n"
-            info += f"Blocks Allocated: {len(file.blocks)}\n"
-            info += f"Block Indices: {file.blocks}\n"
-            info += f"Allocation Method: {self.file_system.allocation_method}\n"
-            if file.content:
-                info += f"Content Preview: {file.content[:100]}...\n"
-            self.info_text.setText(info)
-        else:
-            self.info_text.setText("File not found")
+        info = f"File Name: {file.name}\n"
+        info += f"Size: {file.size} bytes\n"
+        info += f"Blocks Allocated: {len(file.blocks)}\n"
+        info += f"Block Indices: {file.blocks}\n"
+        info += f"Allocation Method: {self.file_system.allocation_method}\n"
+        if file.content:
+            info += f"Content Preview: {file.content[:100]}...\n"
+        self.info_text.setText(info)
 
     def show_directory_info(self, directory):
         """Show information about a directory."""
         info = f"Directory: {directory.get_path()}\n"
         info += f"Files: {len(directory.files)}\n"
         info += f"Subdirectories: {len(directory.subdirectories)}\n"
-        total_size = sum(f.size for f in directory.files)
-        info += f"Total File Size: {total_size} bytes\n"
+        info += f"Total File Size: {directory.total_size()} bytes\n"
         self.info_text.setText(info)
 
-    def show_directory_info_by_name(self, dir_name):
-        """Find and show directory info by name."""
-        def find_directory(directory, name):
-            if directory.name == name:
-                return directory
-            for subdir in directory.subdirectories:
-                result = find_directory(subdir, name)
-                if result:
-                    return result
-            return None
-
-        directory = find_directory(self.file_system.root, dir_name)
-        if directory:
-            self.show_directory_info(directory)
-        else:
-            self.info_text.setText("Directory not found")
-
     def on_reset(self):
         self.file_system = FileSystem()
         self.disk_widget.file_system = self.file_system
         self.directory_tree.file_system = self.file_system
+        self._dirty_dirs = {}
         self.directory_tree.refresh_tree()
         self.disk_widget.update()
         self.update_disk_usage()
@@ -3,19 +3,25 @@ from enum import Enum
 import time
 import threading
 import queue
+import bisect
+import itertools
+import math
 
 class IORequestType(Enum):
     READ = "read"
     WRITE = "write"
 
 class IORequest:
+    __slots__ = ('request_id', 'process_id', 'request_type', 'block_number', 'arrival_time',
+                 'start_time', 'completion_time', 'waiting_time', 'service_time')
+
     def __init__(self, request_id: str, process_id: str, request_type: IORequestType,
                  block_number: int, arrival_time: float = None):
         self.request_id = request_id
         self.process_id = process_id
         self.request_type = request_type
         self.block_number = block_number
-        self.arrival_time = arrival_time or time.time()
+        self.arrival_time = time.time() if arrival_time is None else arrival_time
         self.start_time = None
         self.completion_time = None
         self.waiting_time = 0
@@ -26,13 +32,16 @@ class IORequest:
 
 class DeviceDriver:
     def __init__(self, device_name: str, seek_time_per_track: float = 1.0,
-                 rotational_latency: float = 0.5, transfer_time_per_block: float = 0.1):
+                 rotational_latency: float = 0.5, transfer_time_per_block: float = 0.1,
+                 real_time_sim: bool = False):
         self.device_name = device_name
         self.seek_time_per_track = seek_time_per_track
         self.rotational_latency = rotational_latency
         self.transfer_time_per_block = transfer_time_per_block
         self.current_position = 0
         self.is_busy = False
+        self.virtual_clock = 0.0  # Simulated time, advanced by each processed request
+        self.real_time_sim = real_time_sim  # Also sleep for each request, for live playback
 
     def calculate_seek_time(self, target_block: int) -> float:
         """Calculate seek time based on distance"""
@@ -44,41 +53,54 @@ class DeviceDriver:
         seek_time = self.calculate_seek_time(request.block_number)
         total_time = seek_time + self.rotational_latency + self.transfer_time_per_block
 
-        request.start_time = time.time()
-        time.sleep(total_time / 1000)  # Simulate processing time (scaled down)
-        request.completion_time = time.time()
+        # Stamped on the driver's virtual clock, not the wall-clock base of arrival_time
+        request.start_time = self.virtual_clock
+        self.virtual_clock += total_time
+        request.completion_time = self.virtual_clock
+        if self.real_time_sim:
+            time.sleep(total_time / 1000)  # Simulate processing time (scaled down)
 
         self.current_position = request.block_number
         return total_time
 
-class Buffer:
+class Buffer(queue.Queue):
+    """Bounded blocking buffer; put() waits while full and get() while empty."""
     def __init__(self, size: int):
-        self.size = size
-        self.data = []
-        self.mutex = threading.Lock()
-        self.not_empty = threading.Condition(self.mutex)
-        self.not_full = threading.Condition(self.mutex)
-
-    def put(self, item):
-        with self.not_full:
-            while len(self.data) >= self.size:
-                self.not_full.wait()
-            self.data.append(item)
-            self.not_empty.notify()
-
-    def get(self):
-        with self.not_empty:
-            while not self.data:
-                self.not_empty.wait()
-            item = self.data.pop(0)
-            self.not_full.notify()
-            return item
-
-    def is_empty(self):
-        return len(self.data) == 0
-
-    def is_full(self):
-        return len(self.data) >= self.size
+        # queue.Queue would treat maxsize <= 0 as unbounded, which the slot ring can't hold
+        if size < 1:
+            raise ValueError("Buffer size must be at least 1")
+        super().__init__(maxsize=size)
+
+    # queue.Queue storage hooks (called with self.mutex held): a preallocated
+    # ring of slots, so put/get only move an index instead of allocating
+    def _init(self, maxsize):
+        self.size = maxsize
+        self.data = [None] * maxsize
+        self.head = self.tail = 0
+        self.count = 0
+
+    def _qsize(self):
+        return self.count
+
+    def _put(self, item):
+        self.data[self.tail] = item
+        self.tail = (self.tail + 1) % self.size
+        self.count += 1
+
+    def _get(self):
+        item = self.data[self.head]
+        self.data[self.head] = None
+        self.head = (self.head + 1) % self.size
+        self.count -= 1
+        return item
+
+    def items(self) -> List[Any]:
+        """Buffered items, oldest first."""
+        with self.mutex:
+            return [self.data[(self.head + i) % self.size] for i in range(self.count)]
+
+    is_empty = queue.Queue.empty
+    is_full = queue.Queue.full
 
 class Spooler:
     def __init__(self, device_driver: DeviceDriver):
@@ -114,25 +136,50 @@ class InterruptController:
     def __init__(self):
         self.interrupts = queue.Queue()
         self.handlers = {}
+        self.batch_types = set()  # Interrupt types whose handler takes a list of data
 
-    def register_handler(self, interrupt_type: str, handler):
+    def register_handler(self, interrupt_type: str, handler, batch: bool = False):
         self.handlers[interrupt_type] = handler
+        if batch:
+            self.batch_types.add(interrupt_type)
+        else:
+            self.batch_types.discard(interrupt_type)
 
     def trigger_interrupt(self, interrupt_type: str, data=None):
         self.interrupts.put((interrupt_type, data))
 
     def process_interrupts(self):
-        while not self.interrupts.empty():
-            interrupt_type, data = self.interrupts.get()
-            if interrupt_type in self.handlers:
-                self.handlers[interrupt_type](data)
+        # Drain everything pending first, so handlers run outside the queue's lock
+        pending = []
+        while True:
+            try:
+                pending.append(self.interrupts.get_nowait())
+            except queue.Empty:
+                break
+
+        # Consecutive interrupts of one type go to a batch handler in a single call
+        for interrupt_type, group in itertools.groupby(pending, key=lambda item: item[0]):
+            handler = self.handlers.get(interrupt_type)
+            if handler is None:
+                continue
+            if interrupt_type in self.batch_types:
+                handler([data for _, data in group])
+            else:
+                for _, data in group:
+                    handler(data)
 
 class IOScheduler:
     @staticmethod
-    def fcfs(requests: List[IORequest], device_driver: DeviceDriver) -> Dict[str, Any]:
+    def fcfs(requests: List[IORequest], device_driver: DeviceDriver, presorted: bool = False) -> Dict[str, Any]:
         """First Come First Served I/O scheduling"""
-        sorted_requests = sorted(requests, key=lambda r: r.arrival_time)
+        # Callers holding requests already in arrival order can skip the copy and sort
+        sorted_requests = requests if presorted else sorted(requests, key=lambda r: r.arrival_time)
         current_time = 0
+        current_position = device_driver.current_position
+        # Drive parameters are fixed for the whole run, so read them once
+        seek_time_per_track = device_driver.seek_time_per_track
+        rotational_latency = device_driver.rotational_latency
+        transfer_time = device_driver.transfer_time_per_block
         schedule = []
         total_seek_time = 0
         total_waiting_time = 0
@@ -141,8 +188,8 @@ class IOScheduler:
             if current_time < request.arrival_time:
                 current_time = request.arrival_time
 
-            seek_time = device_driver.calculate_seek_time(request.block_number)
-            service_time = seek_time + device_driver.rotational_latency + device_driver.transfer_time_per_block
+            seek_time = abs(request.block_number - current_position) * seek_time_per_track
+            service_time = seek_time + rotational_latency + transfer_time
 
             request.start_time = current_time
             request.completion_time = current_time + service_time
@@ -158,8 +205,9 @@ class IOScheduler:
             total_seek_time += seek_time
             total_waiting_time += request.waiting_time
             current_time = request.completion_time
-            device_driver.current_position = request.block_number
+            current_position = request.block_number
 
+        device_driver.current_position = current_position
         avg_waiting_time = total_waiting_time / len(requests) if requests else 0
         avg_seek_time = total_seek_time / len(requests) if requests else 0
 
@@ -174,33 +222,48 @@ class IOScheduler:
     @staticmethod
     def sstf(requests: List[IORequest], device_driver: DeviceDriver) -> Dict[str, Any]:
         """Shortest Seek Time First I/O scheduling"""
-        requests_copy = requests.copy()
+        # Requests in arrival order; the original index breaks ties like the list order did
+        arrivals = sorted(enumerate(requests), key=lambda ir: ir[1].arrival_time)
+        n = len(arrivals)
+        next_arrival_idx = 0
+        ready = []  # (block_number, index, request), kept sorted with bisect
         current_time = 0
         current_position = device_driver.current_position
+        rotational_latency = device_driver.rotational_latency
+        transfer_time = device_driver.transfer_time_per_block
         schedule = []
         total_seek_time = 0
         total_waiting_time = 0
 
-        while requests_copy:
-            # Find request with minimum seek time
-            min_seek = float('inf')
-            next_request = None
-
-            for request in requests_copy:
-                if request.arrival_time <= current_time:
-                    seek_time = abs(request.block_number - current_position)
-                    if seek_time < min_seek:
-                        min_seek = seek_time
-                        next_request = request
-
-            if next_request is None:
-                # No requests ready, advance time
-                current_time += 1
-                continue
+        while ready or next_arrival_idx < n:
+            # Add arrived requests
+            while next_arrival_idx < n and arrivals[next_arrival_idx][1].arrival_time <= current_time:
+                idx, request = arrivals[next_arrival_idx]
+                bisect.insort(ready, (request.block_number, idx, request))
+                next_arrival_idx += 1
 
-            requests_copy.remove(next_request)
+            if not ready:
+                # No requests ready: advance time in whole steps up to the next arrival
+                current_time += math.ceil(arrivals[next_arrival_idx][1].arrival_time - current_time)
+                continue
 
-            service_time = min_seek + device_driver.rotational_latency + device_driver.transfer_time_per_block
+            # The closest request is the first one at or above the head, or the
+            # first one at the nearest block below it
+            pos = bisect.bisect_left(ready, (current_position,))
+            chosen = pos
+            if pos > 0:
+                below = bisect.bisect_left(ready, (ready[pos - 1][0],))
+                if pos == len(ready):
+                    chosen = below
+                else:
+                    seek_below = current_position - ready[below][0]
+                    seek_above = ready[pos][0] - current_position
+                    if seek_below < seek_above or (seek_below == seek_above and ready[below][1] < ready[pos][1]):
+                        chosen = below
+            next_request = ready.pop(chosen)[2]
+            min_seek = abs(next_request.block_number - current_position)
+
+            service_time = min_seek + rotational_latency + transfer_time
 
             next_request.start_time = current_time
             next_request.completion_time = current_time + service_time
@@ -235,38 +298,41 @@ class IOScheduler:
         requests_copy = sorted(requests, key=lambda r: r.arrival_time)
         current_time = 0
         current_position = device_driver.current_position
+        rotational_latency = device_driver.rotational_latency
+        transfer_time = device_driver.transfer_time_per_block
         schedule = []
         total_seek_time = 0
         total_waiting_time = 0
-        pending_requests = []
+        pending_requests = []  # (block_number, arrival order, request), kept sorted with bisect
 
-        for request in requests_copy:
-            # Add request to pending when it arrives
-            while current_time < request.arrival_time:
-                current_time += 1
+        for order, request in enumerate(requests_copy):
+            # Add request to pending when it arrives, advancing time in whole steps
+            if current_time < request.arrival_time:
+                current_time += math.ceil(request.arrival_time - current_time)
 
-            pending_requests.append(request)
+            bisect.insort(pending_requests, (request.block_number, order, request))
 
             # Process pending requests using SCAN
             while pending_requests:
-                # Get requests in current direction
-                direction_requests = [r for r in pending_requests if
-                                    (direction > 0 and r.block_number >= current_position) or
-                                    (direction < 0 and r.block_number <= current_position)]
-
-                if not direction_requests:
+                # Nearest block in the current direction; among equal blocks the earliest arrival
+                if direction > 0:
+                    pos = bisect.bisect_left(pending_requests, (current_position,))
+                    found = pos < len(pending_requests)
+                else:
+                    pos = bisect.bisect_right(pending_requests, (current_position, math.inf))
+                    found = direction < 0 and pos > 0
+                    if found:
+                        pos = bisect.bisect_left(pending_requests, (pending_requests[pos - 1][0],))
+
+                if not found:
                     # Reverse direction
                     direction = -direction
                     continue
 
-                # Sort by block number in current direction
-                direction_requests.sort(key=lambda r: r.block_number, reverse=(direction < 0))
-
-                next_request = direction_requests[0]
-                pending_requests.remove(next_request)
+                next_request = pending_requests.pop(pos)[2]
 
                 seek_time = abs(next_request.block_number - current_position)
-                service_time = seek_time + device_driver.rotational_latency + device_driver.transfer_time_per_block
+                service_time = seek_time + rotational_latency + transfer_time
 
                 next_request.start_time = current_time
                 next_request.completion_time = current_time + service_time
@@ -4,8 +4,8 @@ from PyQt6.QtWidgets import (
     QGroupBox, QFormLayout, QProgressBar, QTextEdit,
     QSplitter, QListWidget, QListWidgetItem, QMessageBox, QCheckBox, QLineEdit
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QPainter, QColor, QFont, QPen, QBrush
+from PyQt6.QtCore import Qt, QTimer, QLine, QPointF, pyqtSignal
+from PyQt6.QtGui import QPainter, QColor, QFont, QFontMetrics, QPen, QBrush, QPolygonF, QStaticText, QPixmap
 from gui.components.base_visualizer import BaseVisualizer
 from .algorithms import (
     IORequest, IORequestType, DeviceDriver, Buffer, Spooler,
@@ -14,66 +14,119 @@ from .algorithms import (
 import random
 import time
 
+REPAINT_INTERVAL_MS = 16  # At most one throttled repaint per frame (~60 Hz)
+
+def _repaint_throttle(widget):
+    """Single-shot timer that repaints widget once after a burst of changes."""
+    timer = QTimer(widget)
+    timer.setSingleShot(True)
+    timer.setInterval(REPAINT_INTERVAL_MS)
+    timer.timeout.connect(widget.update)
+    return timer
+
 class DiskVisualizationWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.requests = []
         self.current_position = 0
         self.max_blocks = 100
+        # Painting resources, built once instead of on every repaint
+        self._gray_pen = QPen(Qt.GlobalColor.gray, 1)
+        self._text_pen = QPen(Qt.GlobalColor.black)
+        # Request dots are drawn as round points: a 6px circle plus its 3px outline
+        self._red_pen = QPen(Qt.GlobalColor.red, 9, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap)
+        self._blue_pen = QPen(Qt.GlobalColor.blue, 3)
+        self._blue_brush = QBrush(Qt.GlobalColor.blue)
+        self._tick_font = QFont("Arial", 8)
+        self._tick_ascent = QFontMetrics(self._tick_font).ascent()
+        self._tick_labels = {}  # block number -> QStaticText
+        self._repaint_timer = _repaint_throttle(self)
+        # Tracks and block numbers only depend on the size, pixel ratio and max_blocks
+        self._bg_pixmap = None
+        self._bg_key = None
         self.setMinimumHeight(200)
 
     def set_data(self, requests, current_position):
         self.requests = requests
         self.current_position = current_position
-        self.update()
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+
+    def _tick_label(self, block):
+        label = self._tick_labels.get(block)
+        if label is None:
+            label = self._tick_labels[block] = QStaticText(str(block))
+        return label
+
+    def resizeEvent(self, event):
+        self._bg_key = None
+        super().resizeEvent(event)
+
+    def _render_background(self, x_scale, track_height):
+        """Paint the static tracks and block numbers into self._bg_pixmap."""
+        dpr = self.devicePixelRatioF()
+        self._bg_pixmap = QPixmap(self.size() * dpr)
+        self._bg_pixmap.setDevicePixelRatio(dpr)
+        self._bg_pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(self._bg_pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
+        # Draw disk tracks
+        painter.setPen(self._gray_pen)
+        painter.drawLines([QLine(int(50 + i * x_scale), 20, int(50 + i * x_scale), track_height)
+                           for i in range(0, self.max_blocks + 1, 10)])
+
+        # Draw block numbers (static text is positioned by its top, drawText by its baseline)
+        painter.setFont(self._tick_font)
+        label_y = track_height + 15 - self._tick_ascent
+        for i in range(0, self.max_blocks + 1, 20):
+            painter.drawStaticText(int(50 + i * x_scale) - 10, label_y, self._tick_label(i))
+        painter.end()
+
+    def paintEvent(self, event):
         width = self.width()
         height = self.height()
-
-        # Draw disk tracks
+        x_scale = (width - 100) / self.max_blocks
         track_height = height - 60
-        painter.setPen(QPen(Qt.GlobalColor.gray, 1))
-        for i in range(0, self.max_blocks + 1, 10):
-            x = 50 + (i / self.max_blocks) * (width - 100)
-            painter.drawLine(int(x), 20, int(x), track_height)
 
-        # Draw block numbers
-        painter.setFont(QFont("Arial", 8))
-        for i in range(0, self.max_blocks + 1, 20):
-            x = 50 + (i / self.max_blocks) * (width - 100)
-            painter.drawText(int(x) - 10, track_height + 15, str(i))
+        key = (width, height, self.devicePixelRatioF(), self.max_blocks)
+        if key != self._bg_key:
+            self._render_background(x_scale, track_height)
+            self._bg_key = key
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._bg_pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Draw requests as dots
-        painter.setPen(QPen(Qt.GlobalColor.red, 3))
-        painter.setBrush(QBrush(Qt.GlobalColor.red))
-        for request in self.requests:
-            x = 50 + (request.block_number / self.max_blocks) * (width - 100)
-            y = track_height / 2
-            painter.drawEllipse(int(x) - 3, int(y) - 3, 6, 6)
+        if self.requests:
+            y = int(track_height / 2)
+            painter.setPen(self._red_pen)
+            painter.drawPoints(QPolygonF([QPointF(int(50 + request.block_number * x_scale), y)
+                                          for request in self.requests]))
 
         # Draw disk head
-        painter.setPen(QPen(Qt.GlobalColor.blue, 3))
-        painter.setBrush(QBrush(Qt.GlobalColor.blue))
-        head_x = 50 + (self.current_position / self.max_blocks) * (width - 100)
+        painter.setPen(self._blue_pen)
+        painter.setBrush(self._blue_brush)
+        head_x = 50 + self.current_position * x_scale
         painter.drawRect(int(head_x) - 5, track_height - 10, 10, 10)
 
         # Draw head position label
-        painter.setPen(QPen(Qt.GlobalColor.black))
+        painter.setPen(self._text_pen)
+        painter.setFont(self._tick_font)
         painter.drawText(int(head_x) - 15, track_height - 15, f"Head: {self.current_position}")
 
 class BufferVisualizationWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.buffer = None
+        self._repaint_timer = _repaint_throttle(self)
         self.setMinimumHeight(100)
 
     def set_buffer(self, buffer):
         self.buffer = buffer
-        self.update()
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
 
     def paintEvent(self, event):
         if not self.buffer:
@@ -86,18 +139,19 @@ class BufferVisualizationWidget(QWidget):
         height = self.height()
 
         # Draw buffer slots
+        items = self.buffer.items()
         slot_width = width / self.buffer.size
         for i in range(self.buffer.size):
             x = i * slot_width
-            color = QColor(200, 200, 200) if i >= len(self.buffer.data) else QColor(100, 200, 100)
+            color = QColor(200, 200, 200) if i >= len(items) else QColor(100, 200, 100)
             painter.fillRect(int(x), 10, int(slot_width) - 2, height - 20, color)
             painter.setPen(QPen(Qt.GlobalColor.black, 1))
             painter.drawRect(int(x), 10, int(slot_width) - 2, height - 20)
 
             # Draw data if present
-            if i < len(self.buffer.data):
+            if i < len(items):
                 painter.setPen(QPen(Qt.GlobalColor.black))
-                painter.drawText(int(x + slot_width/2 - 10), height/2 + 5, str(self.buffer.data[i]))
+                painter.drawText(int(x + slot_width/2 - 10), height/2 + 5, str(items[i]))
 
 class IOManagementVisualizer(BaseVisualizer):
     def __init__(self):
@@ -116,9 +170,9 @@ class IOManagementVisualizer(BaseVisualizer):
         self.schedule_result = None
         self.setup_specific_ui()
 
-        # Setup interrupt handlers
-        self.interrupt_controller.register_handler("io_complete", self.on_io_complete)
-        self.interrupt_controller.register_handler("buffer_full", self.on_buffer_full)
+        # Setup interrupt handlers; each drain hands them all pending data at once
+        self.interrupt_controller.register_handler("io_complete", self.on_io_complete, batch=True)
+        self.interrupt_controller.register_handler("buffer_full", self.on_buffer_full, batch=True)
 
     def setup_specific_ui(self):
         # Algorithm selection
@@ -255,24 +309,40 @@ class IOManagementVisualizer(BaseVisualizer):
             QMessageBox.warning(self, "Error", str(e))
 
     def generate_random_requests(self):
-        self.requests.clear()
-        for i in range(8):
-            request_id = f"R{i+1}"
-            process_id = f"P{random.randint(1, 3)}"
-            request_type = random.choice([IORequestType.READ, IORequestType.WRITE])
-            block_number = random.randint(0, 99)
-            request = IORequest(request_id, process_id, request_type, block_number)
-            self.requests.append(request)
+        # Draw each field for the whole batch at once
+        n = 8
+        process_ids = random.choices(("P1", "P2", "P3"), k=n)
+        request_types = random.choices((IORequestType.READ, IORequestType.WRITE), k=n)
+        block_numbers = random.choices(range(100), k=n)
+        self.requests[:] = [IORequest(f"R{i+1}", process_id, request_type, block_number)
+                            for i, (process_id, request_type, block_number)
+                            in enumerate(zip(process_ids, request_types, block_numbers))]
         self.update_request_table()
         self.disk_widget.set_data(self.requests, self.device_driver.current_position)
 
     def update_request_table(self):
-        self.request_table.setRowCount(len(self.requests))
-        for i, request in enumerate(self.requests):
-            self.request_table.setItem(i, 0, QTableWidgetItem(request.request_id))
-            self.request_table.setItem(i, 1, QTableWidgetItem(request.process_id))
-            self.request_table.setItem(i, 2, QTableWidgetItem(request.request_type.value))
-            self.request_table.setItem(i, 3, QTableWidgetItem(str(request.block_number)))
+        table = self.request_table
+        # Fill the table in one batch: no per-cell signals, re-sorts or repaints
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        sorting = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        try:
+            table.setRowCount(len(self.requests))
+            for i, request in enumerate(self.requests):
+                values = (request.request_id, request.process_id,
+                          request.request_type.value, str(request.block_number))
+                for column, text in enumerate(values):
+                    # Reuse the cell's item where there is one instead of allocating a new one
+                    item = table.item(i, column)
+                    if item is None:
+                        table.setItem(i, column, QTableWidgetItem(text))
+                    else:
+                        item.setText(text)
+        finally:
+            table.setSortingEnabled(sorting)
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
 
     def on_play(self):
         if not self.requests:
@@ -293,6 +363,8 @@ class IOManagementVisualizer(BaseVisualizer):
         self.update_request_table()
         self.disk_widget.set_data([], 0)
         self.buffer_widget.set_buffer(self.buffer)
+        # Flush interrupts still waiting for their drain so they don't land in the cleared log
+        self.interrupt_controller.process_interrupts()
         self.interrupt_log.clear()
         self.results_label.setText("")
         self.update_status("Reset")
@@ -300,7 +372,8 @@ class IOManagementVisualizer(BaseVisualizer):
     def run_scheduling(self):
         try:
             if self.current_algorithm == "FCFS":
-                result = IOScheduler.fcfs(self.requests, self.device_driver)
+                # Requests are only ever appended as they are created, so they are in arrival order
+                result = IOScheduler.fcfs(self.requests, self.device_driver, presorted=True)
             elif self.current_algorithm == "SSTF":
                 result = IOScheduler.sstf(self.requests, self.device_driver)
             elif self.current_algorithm == "SCAN":
@@ -328,7 +401,7 @@ class IOManagementVisualizer(BaseVisualizer):
         self.device_driver.current_position = request.block_number
 
         # Simulate buffer operation
-        if len(self.buffer.data) < self.buffer.size:
+        if not self.buffer.is_full():
             self.buffer.put(f"Req:{request.request_id}")
         else:
             self.interrupt_controller.trigger_interrupt("buffer_full", f"Buffer full for {request.request_id}")
@@ -338,16 +411,20 @@ class IOManagementVisualizer(BaseVisualizer):
         # Trigger completion interrupt
         self.interrupt_controller.trigger_interrupt("io_complete", request.request_id)
 
-        # Process interrupts
-        self.interrupt_controller.process_interrupts()
+        # Process interrupts once control returns to the event loop, so the
+        # timer tick finishes first; the handlers still run on the GUI thread
+        QTimer.singleShot(0, self.process_pending_interrupts)
 
         self.animation_index += 1
 
-    def on_io_complete(self, request_id):
-        self.interrupt_log.append(f"I/O Complete: {request_id}")
+    def process_pending_interrupts(self):
+        self.interrupt_controller.process_interrupts()
+
+    def on_io_complete(self, request_ids):
+        self.interrupt_log.append("\n".join(f"I/O Complete: {request_id}" for request_id in request_ids))
 
     def on_buffer_full(self, data):
-        self.interrupt_log.append(f"Buffer Full: {data}")
+        self.interrupt_log.append("\n".join(f"Buffer Full: {item}" for item in data))
 
     def display_results(self, result):
         text = f"Total Seek Time: {result['total_seek_time']:.2f}\n"
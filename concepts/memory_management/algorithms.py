@@ -1,7 +1,9 @@
 from typing import List, Dict, Any, Optional
-import copy
+from collections import OrderedDict
 
 class MemoryBlock:
+    __slots__ = ('start', 'size', 'process_id', 'is_free')
+
     def __init__(self, start: int, size: int, process_id: str = None):
         self.start = start
         self.size = size
@@ -12,6 +14,8 @@ class MemoryBlock:
         return f"MemoryBlock(start={self.start}, size={self.size}, process='{self.process_id}', free={self.is_free})"
 
 class PageTableEntry:
+    __slots__ = ('page_number', 'frame_number', 'valid', 'referenced', 'modified')
+
     def __init__(self, page_number: int, frame_number: int = None, valid: bool = False):
         self.page_number = page_number
         self.frame_number = frame_number
@@ -20,6 +24,8 @@ class PageTableEntry:
         self.modified = False
 
 class SegmentTableEntry:
+    __slots__ = ('segment_number', 'base', 'limit')
+
     def __init__(self, segment_number: int, base: int, limit: int):
         self.segment_number = segment_number
         self.base = base
@@ -51,16 +57,12 @@ class MemoryManager:
     @staticmethod
     def best_fit(blocks: List[MemoryBlock], process_size: int, process_id: str) -> Optional[int]:
         """Best Fit allocation strategy."""
-        best_index = -1
-        best_size = float('inf')
+        # Smallest fitting free block; the index in the key keeps the first one on ties
+        best = min(((block.size, i) for i, block in enumerate(blocks)
+                    if block.is_free and block.size >= process_size), default=None)
 
-        for i, block in enumerate(blocks):
-            if block.is_free and block.size >= process_size:
-                if block.size < best_size:
-                    best_size = block.size
-                    best_index = i
-
-        if best_index != -1:
+        if best is not None:
+            best_index = best[1]
             block = blocks[best_index]
             allocated_size = process_size
             remaining_size = block.size - allocated_size
@@ -79,16 +81,12 @@ class MemoryManager:
     @staticmethod
     def worst_fit(blocks: List[MemoryBlock], process_size: int, process_id: str) -> Optional[int]:
         """Worst Fit allocation strategy."""
-        worst_index = -1
-        worst_size = -1
-
-        for i, block in enumerate(blocks):
-            if block.is_free and block.size >= process_size:
-                if block.size > worst_size:
-                    worst_size = block.size
-                    worst_index = i
+        # Largest fitting free block; the negated index keeps the first one on ties
+        worst = max(((block.size, -i) for i, block in enumerate(blocks)
+                     if block.is_free and block.size >= process_size), default=None)
 
-        if worst_index != -1:
+        if worst is not None:
+            worst_index = -worst[1]
             block = blocks[worst_index]
             allocated_size = process_size
             remaining_size = block.size - allocated_size
@@ -115,14 +113,14 @@ class MemoryManager:
                 block.is_free = True
                 deallocated = True
 
-        # Merge adjacent free blocks
-        i = 0
-        while i < len(blocks) - 1:
-            if blocks[i].is_free and blocks[i + 1].is_free:
-                blocks[i].size += blocks[i + 1].size
-                blocks.pop(i + 1)
+        # Merge adjacent free blocks in one pass, then swap the result in place
+        merged = []
+        for block in blocks:
+            if block.is_free and merged and merged[-1].is_free:
+                merged[-1].size += block.size
             else:
-                i += 1
+                merged.append(block)
+        blocks[:] = merged
 
         return deallocated
 
@@ -170,12 +168,11 @@ class PageReplacement:
         """LRU page replacement algorithm."""
         frames = []
         page_faults = 0
-        recent_use = {}  # page -> last used time
-        time = 0
+        # page -> frame index, ordered from least to most recently used
+        recent_use = OrderedDict()
         history = []
 
         for page in page_sequence:
-            time += 1
             step_info = {
                 'page': page,
                 'frames': frames.copy(),
@@ -183,22 +180,20 @@ class PageReplacement:
                 'replaced': None
             }
 
-            if page in frames:
-                recent_use[page] = time
+            if page in recent_use:
+                recent_use.move_to_end(page)
             else:
                 page_faults += 1
                 step_info['fault'] = True
 
                 if len(frames) < num_frames:
+                    recent_use[page] = len(frames)
                     frames.append(page)
-                    recent_use[page] = time
                 else:
-                    # Find least recently used
-                    lru_page = min(frames, key=lambda p: recent_use[p])
-                    idx = frames.index(lru_page)
+                    # Evict the least recently used page, reusing its frame
+                    lru_page, idx = recent_use.popitem(last=False)
                     frames[idx] = page
-                    recent_use[page] = time
-                    del recent_use[lru_page]
+                    recent_use[page] = idx
                     step_info['replaced'] = lru_page
 
             history.append(step_info)
@@ -218,22 +213,16 @@ class PageReplacement:
         page_faults = 0
         history = []
 
-        def find_optimal_victim(current_idx: int) -> int:
-            """Find the page that will be used farthest in the future."""
-            farthest = -1
-            victim_idx = -1
-
-            for i, page in enumerate(frames):
-                try:
-                    next_use = page_sequence.index(page, current_idx + 1)
-                except ValueError:
-                    next_use = float('inf')
+        # next_occurrence[i]: the next index after i referencing the same page (inf if none)
+        next_occurrence = [float('inf')] * len(page_sequence)
+        last_seen = {}
+        for i in range(len(page_sequence) - 1, -1, -1):
+            page = page_sequence[i]
+            next_occurrence[i] = last_seen.get(page, float('inf'))
+            last_seen[page] = i
 
-                if next_use > farthest:
-                    farthest = next_use
-                    victim_idx = i
-
-            return victim_idx
+        frame_of = {}  # page -> frame index
+        next_use_of_frame = []  # frame index -> next use of the page it holds
 
         for idx, page in enumerate(page_sequence):
             step_info = {
@@ -243,16 +232,24 @@ class PageReplacement:
                 'replaced': None
             }
 
-            if page not in frames:
+            if page in frame_of:
+                next_use_of_frame[frame_of[page]] = next_occurrence[idx]
+            else:
                 page_faults += 1
                 step_info['fault'] = True
 
                 if len(frames) < num_frames:
+                    frame_of[page] = len(frames)
                     frames.append(page)
+                    next_use_of_frame.append(next_occurrence[idx])
                 else:
-                    victim_idx = find_optimal_victim(idx)
+                    # Victim: the page used farthest in the future (first such frame on ties)
+                    victim_idx = max(range(len(frames)), key=next_use_of_frame.__getitem__)
                     replaced = frames[victim_idx]
+                    del frame_of[replaced]
                     frames[victim_idx] = page
+                    frame_of[page] = victim_idx
+                    next_use_of_frame[victim_idx] = next_occurrence[idx]
                     step_info['replaced'] = replaced
 
             history.append(step_info)
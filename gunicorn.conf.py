@@ -0,0 +1,12 @@
+import multiprocessing
+import os
+
+# Serve the Flask app with the usual 2 * cores + 1 workers, each running a few
+# request threads. The /cpu_scheduling/compare pool is only started by a worker on
+# its first comparison, so it costs nothing for the other routes. The app is not
+# preloaded so every worker builds its per-process resources after the fork.
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+workers = multiprocessing.cpu_count() * 2 + 1
+worker_class = "gthread"
+threads = 4
+timeout = 30